@@ -0,0 +1,70 @@
+import math
+from typing import Dict
+
+class ConvergenceMonitor:
+    def __init__(self, patience: int = None, hypervolume_tolerance: float = None,
+                 hypervolume_window: int = 5, min_diversity: float = None):
+        """
+        Early-stopping rules for one GA run of one size-distance group. Every rule
+        that is set is checked after each generation; the first one met ends the run.
+        Args:
+            patience (int): stop after this many generations without a better best fitness,
+                counted from the first generation with a feasible solution.
+            hypervolume_tolerance (float): stop when the hypervolume of the rank-0 front,
+                with objectives scaled by their bounds, changed by less than this over hypervolume_window
+                generations. Generations with a zero hypervolume are not counted.
+            hypervolume_window (int): generations compared by the hypervolume rule.
+            min_diversity (float): stop when distinct genotypes / population size falls below this.
+        """
+        self.patience = patience
+        self.hypervolume_tolerance = hypervolume_tolerance
+        self.hypervolume_window = hypervolume_window
+        self.min_diversity = min_diversity
+
+        self.generations_used = 0
+        self.stop_reason = 'generations'
+        self._best_fitness = float('-inf')
+        self._stale_generations = 0
+        self._hypervolumes = []
+
+    @property
+    def tracks_hypervolume(self) -> bool:
+        return self.hypervolume_tolerance is not None
+
+    def _stop(self, reason: str) -> bool:
+        self.stop_reason = reason
+        return True
+
+    def update(self, best_fitness: float, hypervolume: float = None, diversity: float = None) -> bool:
+        """
+        Records one finished generation.
+        Args:
+            best_fitness (float): best fitness found so far.
+            hypervolume (float): rank-0 hypervolume of the population, needed when tracks_hypervolume.
+            diversity (float): distinct genotypes / population size.
+        Returns:
+            bool: True when the run should stop.
+        """
+        self.generations_used += 1
+        if best_fitness > self._best_fitness:
+            self._best_fitness = best_fitness
+            self._stale_generations = 0
+        elif math.isfinite(self._best_fitness):
+            # Generations before the first feasible fleet are never stale
+            self._stale_generations += 1
+
+        if self.min_diversity is not None and diversity is not None and diversity < self.min_diversity:
+            return self._stop('diversity')
+        if self.patience is not None and self._stale_generations >= self.patience:
+            return self._stop('stagnation')
+        # A zero hypervolume means no feasible point yet, not a converged front
+        if self.tracks_hypervolume and hypervolume:
+            self._hypervolumes.append(hypervolume)
+            if len(self._hypervolumes) > self.hypervolume_window:
+                change = abs(self._hypervolumes[-1] - self._hypervolumes[-1 - self.hypervolume_window])
+                if change < self.hypervolume_tolerance:
+                    return self._stop('hypervolume')
+        return False
+
+    def report(self) -> Dict:
+        return {"Generations_Used": self.generations_used, "Stop_Reason": self.stop_reason}
@@ -1,5 +1,5 @@
 import pandas as pd
-from utilities.my_sql_operations import MySQLOperations
+from utilities.reference_data import ReferenceData
 from utilities.carbon_emmissions import CarbonEmissions
 from utilities.costs import Costs
 
@@ -8,19 +8,11 @@ class VehicleAllocation:
         pass
   
     def allocate_vehicles(self, year):
-        my_sql_operations = MySQLOperations() 
-        
-        query = f"""SELECT * FROM vehicles"""
-        vehicles_data, columns = my_sql_operations.fetch_data(query)
-        vehicles_df = pd.DataFrame(vehicles_data, columns=columns)
-                
-        query = f"""SELECT * FROM demand"""
-        demand_data, columns = my_sql_operations.fetch_data(query)
-        demand_df = pd.DataFrame(demand_data, columns=columns)
-                
-        query = f"""SELECT * FROM vehicles_fuels"""
-        vehicle_fuels_data, columns = my_sql_operations.fetch_data(query)
-        vehicle_fuels_df = pd.DataFrame(vehicle_fuels_data, columns=columns)
+        reference_data = ReferenceData()
+        
+        vehicles_df = reference_data.table('vehicles')
+        demand_df = reference_data.table('demand')
+        vehicle_fuels_df = reference_data.table('vehicles_fuels')
 
         distance_mapping = {"D1": 1, "D2": 2, "D3": 3, "D4": 4}
         
@@ -30,19 +22,20 @@ class VehicleAllocation:
         demand_df = demand_df[demand_df['year'] == year].copy()
         available_vehicles = vehicles_df[vehicles_df['year'] == year]
 
-        def find_allocations(row):
-            size_needed = row['size']
-            distance_needed = row['Distance_categorical']
-            allocated_vehicles = available_vehicles[
-                (available_vehicles['size'] == size_needed) & 
-                (available_vehicles['Distance_categorical'] >= distance_needed)
-            ]['id'].tolist() 
-            
-            return allocated_vehicles
-        
-        demand_df['Allocation'] = demand_df.apply(find_allocations, axis=1)  
-        
-        df_exploded = demand_df.explode("Allocation")
+        # Eligible vehicles per demand row: same size and a distance category at least the demand's.
+        # One join on size replaces a filter per row; rows are kept in demand order, then vehicle order,
+        # and demand rows without any eligible vehicle keep a single row with no allocation.
+        demand_df['_demand_row'] = range(len(demand_df))
+        vehicle_keys = available_vehicles[['size', 'Distance_categorical', 'id']].rename(
+            columns={'Distance_categorical': '_vehicle_distance', 'id': 'Allocation'}
+        )
+        vehicle_keys['_vehicle_row'] = range(len(vehicle_keys))
+        eligible = demand_df[['_demand_row', 'size', 'Distance_categorical']].merge(vehicle_keys, on='size')
+        eligible = eligible[eligible['_vehicle_distance'] >= eligible['Distance_categorical']]
+
+        df_exploded = demand_df.merge(eligible[['_demand_row', '_vehicle_row', 'Allocation']], on='_demand_row', how='left')
+        df_exploded = df_exploded.sort_values(['_demand_row', '_vehicle_row'], kind='stable')
+        
         df = pd.merge(df_exploded[['Allocation', 'year', 'size', 'distance', 'demand']], vehicles_df[['id','vehicle', 'year', 'cost', 'yearly_range', 'distance']], how='left', left_on='Allocation', right_on='id')
         
         df = df.rename(columns={'year_x': 'Operating Year', 'year_y': 'Available Year', 'distance_x': 'Distance_demand', 'distance_y': 'Distance_vehicle'})
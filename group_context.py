@@ -0,0 +1,160 @@
+import hashlib
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Tuple
+
+def group_seed_sequences(seed: int, year: int, keys: Iterable[Tuple]) -> Dict:
+    """
+    One SeedSequence per size-distance group for the year, derived from the run
+    seed. Each group's spawn key is the year plus a stable hash of its (size,
+    distance) key, so its stream does not depend on which other groups are
+    optimised or where it runs. Without a run seed every group still gets its
+    own fresh, independent stream.
+    Args:
+        seed (int): run seed, or None.
+        year (int): operating year.
+        keys: (size, distance) group keys.
+    Returns:
+        dict: SeedSequence per group key.
+    """
+    seeds = {}
+    for size, distance in keys:
+        digest = hashlib.sha256(f"{size}\x1f{distance}".encode()).digest()
+        seeds[(size, distance)] = np.random.SeedSequence(seed, spawn_key=(year, int.from_bytes(digest[:8], 'little')))
+    return seeds
+
+
+class GroupContext:
+    def __init__(self, size_distance: Tuple, vehicles: List[Dict], max_vehicles: int,
+                 calculate_total_cost: Callable, calculate_total_emissions: Callable):
+        """
+        Invariants of one size-distance group, built once per optimizer.
+        Args:
+            size_distance (tuple): (size, distance) group key.
+            vehicles (list): vehicle records of the group as built by _group_vehicles.
+            max_vehicles (int): maximum number of vehicles allowed in the group.
+            calculate_total_cost (callable): optimizer's per-vehicle cost function, used for the normalisation bounds.
+            calculate_total_emissions (callable): optimizer's per-vehicle emissions function.
+        """
+        self.size_distance = size_distance
+        self.vehicles = vehicles
+        self.max_vehicles = max_vehicles
+        self.demand = vehicles[0]['demand']
+
+        # Solutions are keyed by vehicle ID; the last record wins for objectives,
+        # the first record is reported in the output rows.
+        self.vehicle_dict = {v['ID']: v for v in vehicles}
+        self.vehicle_records = {}
+        for v in vehicles:
+            self.vehicle_records.setdefault(v['ID'], v)
+
+        self.ids = list(self.vehicle_dict.keys())
+        self.index = {vehicle_id: i for i, vehicle_id in enumerate(self.ids)}
+
+        rows = list(self.vehicle_dict.values())
+        self.fixed_cost = self._column(rows, 'insurance_cost') + self._column(rows, 'maintenance_cost') + self._column(rows, 'Cost ($)')
+        self.fuel_costs_per_km = self._column(rows, 'fuel_costs_per_km')
+        self.carbon_emissions_per_km = self._column(rows, 'carbon_emissions_per_km')
+        self.yearly_range = self._column(rows, 'Yearly range (km)')
+        self.rank = self._column(rows, 'Rank')
+
+        if max_vehicles > 0:
+            self.max_possible_cost = max(calculate_total_cost(max_vehicles, v) for v in vehicles)
+            self.max_possible_emissions = max(calculate_total_emissions(max_vehicles, v) for v in vehicles)
+        else:
+            self.max_possible_cost = 0
+            self.max_possible_emissions = 0
+
+    @staticmethod
+    def _column(rows: List[Dict], field: str) -> np.ndarray:
+        return np.array([float(v.get(field, 0) or 0) for v in rows], dtype=float)
+
+    @property
+    def n_types(self) -> int:
+        return len(self.ids)
+
+    @property
+    def objective_bounds(self) -> Tuple[float, float]:
+        """
+        Upper bounds of the cost and emissions of any valid solution, used to scale
+        objectives to [0, 1]. Fuel cost and emissions are paid once per vehicle type
+        used, so a mixed fleet can exceed max_possible_cost and max_possible_emissions.
+        """
+        demand = float(self.demand)
+        cost = self.max_vehicles * self.fixed_cost.max(initial=0) + demand * self.fuel_costs_per_km.sum()
+        emissions = demand * self.carbon_emissions_per_km.sum()
+        return cost or 1.0, emissions or 1.0
+
+    @property
+    def topsis_weights(self) -> np.ndarray:
+        """TOPSIS scores normalised to probabilities, uniform when they are all zero"""
+        total = self.rank.sum()
+        return self.rank / total if total > 0 else np.full(self.n_types, 1 / self.n_types)
+
+    def is_feasible(self, counts: np.ndarray):
+        """
+        Whether a fleet has no negative counts, between 1 and max_vehicles vehicles and a
+        yearly range covering the demand. Accepts one count vector, or a matrix with one fleet per row.
+        """
+        total = counts.sum(axis=-1)
+        return ((counts >= 0).all(axis=-1) & (total > 0) & (total <= self.max_vehicles)
+                & (counts @ self.yearly_range >= self.demand))
+
+    def repair(self, counts, rng: np.random.Generator, weights: np.ndarray = None) -> np.ndarray:
+        """
+        Projects a count vector onto the feasible region. Shortest-range vehicles are
+        dropped while the fleet is too large, or too large to still cover the demand
+        with its free slots; the fleet is then completed one vehicle at a time, drawing
+        types by weights among those that leave the demand coverable. A feasible vector
+        is returned unchanged.
+        Args:
+            counts: vehicle counts in context order.
+            rng (np.random.Generator): stream used to draw added vehicle types.
+            weights (np.ndarray): type probabilities, topsis_weights by default.
+        Returns:
+            np.ndarray: feasible count vector.
+        """
+        counts = np.maximum(np.asarray(counts, dtype=np.int64), 0)
+        if self.max_vehicles <= 0 or self.n_types == 0:
+            return np.zeros(self.n_types, dtype=np.int64)
+        if self.is_feasible(counts):
+            return counts
+        weights = self.topsis_weights if weights is None else weights
+        demand = float(self.demand)
+        longest = self.yearly_range.max()
+        total = int(counts.sum())
+        capacity = float(counts @ self.yearly_range)
+
+        for i in np.argsort(self.yearly_range, kind='stable'):
+            while counts[i] > 0 and (total > self.max_vehicles
+                                     or capacity + (self.max_vehicles - total) * longest < demand):
+                counts[i] -= 1
+                total -= 1
+                capacity -= self.yearly_range[i]
+
+        while total < self.max_vehicles and (total == 0 or capacity < demand):
+            slots_after = self.max_vehicles - total - 1
+            allowed = capacity + self.yearly_range + slots_after * longest >= demand
+            if not allowed.any():
+                allowed = self.yearly_range == longest
+            p = np.where(allowed, weights, 0)
+            p = p / p.sum() if p.sum() > 0 else allowed / allowed.sum()
+            i = rng.choice(self.n_types, p=p)
+            counts[i] += 1
+            total += 1
+            capacity += self.yearly_range[i]
+        return counts
+
+    def sample_feasible(self, rng: np.random.Generator, weights: np.ndarray = None) -> np.ndarray:
+        """Builds a feasible fleet from scratch, adding vehicles until the demand is covered"""
+        return self.repair(np.zeros(self.n_types, dtype=np.int64), rng, weights)
+
+    def to_vector(self, solution: Dict) -> np.ndarray:
+        """Converts a {vehicle_id: count} solution to a count vector in context order"""
+        counts = np.zeros(self.n_types, dtype=np.int64)
+        for vehicle_id, num_vehicles in solution.items():
+            counts[self.index[vehicle_id]] = num_vehicles
+        return counts
+
+    def to_solution(self, counts) -> Dict:
+        """Converts a count vector back to a {vehicle_id: count} solution"""
+        return {vehicle_id: int(count) for vehicle_id, count in zip(self.ids, counts)}
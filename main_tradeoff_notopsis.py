@@ -5,14 +5,17 @@ from utilities.evaluation import Evaluation
 from utilities.summary import Summary
 from utilities.costs import Costs
 from utilities.carbon_emmissions import CarbonEmissions
+from utilities.reference_data import ReferenceData
 
 from utilities.my_sql_operations import MySQLOperations
 import pandas as pd
 import os
 from pprint import pprint
 
-def optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year):
+def optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year, seed=None):
     print(cost_weight, ce_weight, generations, population_size, prev_years)
+    # Reference tables are read once per run and shared by every year
+    ReferenceData.invalidate()
     va = VehicleAllocation()
     # tps = Topsis()
     eval = Evaluation()
@@ -41,9 +44,7 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
             merged_df.drop('demand', axis=1, inplace=True)
             ## UPDATING VALUES FOR OPERATING COSTS AND DEMAND COLUMNS
             
-            query = f"""SELECT * FROM demand WHERE year = {year};"""
-            demand_data, columns = sqlops.fetch_data(query)
-            demand_df = pd.DataFrame(demand_data, columns=columns)
+            demand_df = ReferenceData().for_year('demand', year)
 
             df = pd.merge(
                 merged_df, 
@@ -82,7 +83,7 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
         # } 
         # tp_df.rename(columns=column_mapping, inplace=True) 
         print(f"Multiobjective Optimization...")
-        mo = MultiObjectiveFleetOptimizer(merged_df, ce_weight, cost_weight)
+        mo = MultiObjectiveFleetOptimizer(merged_df, ce_weight, cost_weight, seed=seed)
         df = mo.get_optimized_results(year, generations, population_size)
 
         # df.to_csv(f'data/output/tradeoff/topsis/multi_objective_fleet_allocation_{year}.csv', index=False)
@@ -100,14 +101,12 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
         # summary_df.to_csv('data/output/tradeoff/topsis/multiobjective_summary.csv')
         print("Summary generated")
         
-        engine = sqlops.create_sqlalchemy_engine(connection_string)
-        df.to_sql(f'multi_objective_fleet_allocation_eval_{year}', con=engine, if_exists='replace') 
-        summary_df.to_sql('notopsis_multiobjective_summary', con=engine, if_exists='replace')
+        sqlops.push_output_data(df, f'multi_objective_fleet_allocation_eval_{year}')
+        sqlops.push_output_data(summary_df, 'notopsis_multiobjective_summary')
         print()
     
     result = pd.concat(output_list)
-    engine = sqlops.create_sqlalchemy_engine(connection_string)
     
     # result.rename(columns=column_mapping, inplace=True)
-    result.to_sql(f'combined_multi_objective_fleet_allocation_eval', con=engine, if_exists='replace') 
+    sqlops.push_output_data(result, 'combined_multi_objective_fleet_allocation_eval') 
     
@@ -1,26 +1,60 @@
 from demand import VehicleAllocation
 from topsis import Topsis
 from tradeoff_topsis import MultiObjectiveFleetOptimizer
+from tradeoff_exact import ExactFleetOptimizer
 from utilities.evaluation import Evaluation
 from utilities.summary import Summary
 from utilities.costs import Costs
 from utilities.carbon_emmissions import CarbonEmissions
+from utilities.reference_data import ReferenceData
+from utilities.group_cache import GroupResultCache
+from utilities.run_registry import RunRegistry
 
 from utilities.my_sql_operations import MySQLOperations
 import pandas as pd
 import os
 from pprint import pprint
 
-def optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year):
-    print(cost_weight, ce_weight, generations, population_size, prev_years)
+OPTIMIZERS = {
+    'ga': MultiObjectiveFleetOptimizer,
+    'exact': ExactFleetOptimizer,
+}
+
+def optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year, engine='ga', tps=None, reuse_results=False, use_registry=False, seed=None):
+    print(cost_weight, ce_weight, generations, population_size, prev_years, engine)
+    optimizer_class = OPTIMIZERS[engine]
+    # Reference tables are read once per run and shared by every year
+    ReferenceData.invalidate()
     va = VehicleAllocation()
-    tps = Topsis()
+    # A caller-owned Topsis keeps each year's normalised matrix for later rescoring
+    tps = Topsis() if tps is None else tps
+    # Stored per-group results are reused when a group's inputs have not changed since an earlier run
+    result_cache = GroupResultCache() if reuse_results else None
     eval = Evaluation()
     summarizer = Summary()
     sqlops = MySQLOperations()
     costs = Costs()
     ce = CarbonEmissions()
     connection_string = os.getenv('OUTPUT_STRING')
+
+    # A run with the same input data and parameters as a stored one is served from the run registry
+    run_id = None
+    registry = RunRegistry() if use_registry else None
+    run_params = {
+        'driver': 'optimization', 'engine': engine, 'cost_weight': cost_weight, 'ce_weight': ce_weight,
+        'generations': generations, 'population_size': population_size, 'prev_years': prev_years,
+        'min_year': min_year, 'max_year': max_year, 'seed': seed,
+    }
+    if registry is not None:
+        run_id = RunRegistry.run_key(data_version=ReferenceData().version(), **run_params)
+        if registry.exists(run_id):
+            print(f"Run {run_id} found in the run registry")
+            registry.publish(run_id, {
+                'allocation': 'combined_multi_objective_fleet_allocation_eval',
+                'summary': 'topsis_multiobjective_summary',
+            })
+            sqlops.create_index('combined_multi_objective_fleet_allocation_eval', 'Operating Year')
+            return run_id
     
     output_list = []
     for year in range(min_year, max_year+1):
@@ -41,9 +75,7 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
             merged_df.drop('demand', axis=1, inplace=True)
             ## UPDATING VALUES FOR OPERATING COSTS AND DEMAND COLUMNS
             
-            query = f"""SELECT * FROM demand WHERE year = {year};"""
-            demand_data, columns = sqlops.fetch_data(query)
-            demand_df = pd.DataFrame(demand_data, columns=columns)
+            demand_df = ReferenceData().for_year('demand', year)
 
             df = pd.merge(
                 merged_df, 
@@ -82,8 +114,8 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
         } 
         tp_df.rename(columns=column_mapping, inplace=True) 
         print(f"Multiobjective Optimization...")
-        mo = MultiObjectiveFleetOptimizer(tp_df, ce_weight, cost_weight)
-        df = mo.get_optimized_results(year, generations, population_size)
+        mo = optimizer_class(tp_df, ce_weight, cost_weight, seed=seed)
+        df = mo.get_optimized_results(year, generations, population_size, result_cache=result_cache)
 
         # df.to_csv(f'data/output/tradeoff/topsis/multi_objective_fleet_allocation_{year}.csv', index=False)
         print("Optimization done, output saved to file")
@@ -100,14 +132,19 @@ def optimization(cost_weight, ce_weight, generations, population_size, prev_year
         # summary_df.to_csv('data/output/tradeoff/topsis/multiobjective_summary.csv')
         print("Summary generated")
         
-        engine = sqlops.create_sqlalchemy_engine(connection_string)
-        df.to_sql(f'multi_objective_fleet_allocation_eval_{year}', con=engine, if_exists='replace') 
-        summary_df.to_sql('topsis_multiobjective_summary', con=engine, if_exists='replace')
+        sqlops.push_output_tables([
+            (df, f'multi_objective_fleet_allocation_eval_{year}', 'replace', True),
+            (summary_df.tail(1), 'topsis_multiobjective_summary', 'append' if year > min_year else 'replace', True),
+        ])
         print()
     
     result = pd.concat(output_list)
-    engine = sqlops.create_sqlalchemy_engine(connection_string)
     
     # result.rename(columns=column_mapping, inplace=True)
-    result.to_sql(f'combined_multi_objective_fleet_allocation_eval', con=engine, if_exists='replace') 
+    sqlops.push_output_data(result, 'combined_multi_objective_fleet_allocation_eval')
+    # The dashboard pages query the combined table one year at a time
+    sqlops.create_index('combined_multi_objective_fleet_allocation_eval', 'Operating Year')
+    if registry is not None:
+        registry.store(run_id, run_params, {'allocation': result, 'summary': summarizer.summary_df})
+    return run_id
     
@@ -1,20 +1,52 @@
 from demand import VehicleAllocation
 from topsis import Topsis
-from tradeoff_topsis_parallelize import MultiObjectiveFleetOptimizer
+from tradeoff_topsis_parallelize import MultiObjectiveFleetOptimizer, OptimizerPool
+from tradeoff_vectorized import VectorizedFleetOptimizer
+from tradeoff_exact import ExactFleetOptimizer
+from tradeoff_front import ParetoFrontOptimizer
 from utilities.evaluation import Evaluation
 from utilities.summary import Summary
 from utilities.costs import Costs
 from utilities.carbon_emmissions import CarbonEmissions
+from utilities.output_sink import AsyncOutputSink
+from utilities.reference_data import ReferenceData
+from utilities.group_cache import GroupResultCache
+from utilities.run_registry import RunRegistry
 
 from utilities.my_sql_operations import MySQLOperations
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 
-def parallel_optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year):
-    print(cost_weight, ce_weight, generations, population_size, prev_years)
+OPTIMIZERS = {
+    'ga': MultiObjectiveFleetOptimizer,
+    'vectorized': VectorizedFleetOptimizer,
+    'exact': ExactFleetOptimizer,
+    'pareto': ParetoFrontOptimizer,
+}
+
+def prepare_year(va: VehicleAllocation, year: int):
+    """
+    Inputs for one operating year that do not depend on the previous year's result:
+    the new-vehicle allocation and that year's demand rows.
+    """
+    df = va.allocate_vehicles(year)
+    demand_df = ReferenceData().for_year('demand', year)
+    return df, demand_df
+
+def parallel_optimization(cost_weight, ce_weight, generations, population_size, prev_years, min_year, max_year, engine='ga', pool=None, prefetch_years=2, persist_years=True, tps=None, reuse_results=False, use_registry=False, seed=None, convergence=None, trace_path=None):
+    print(cost_weight, ce_weight, generations, population_size, prev_years, engine)
+    optimizer_class = OPTIMIZERS[engine]
+    if trace_path is not None and engine != 'ga':
+        raise ValueError(f"Per-generation traces are only recorded by the 'ga' engine, not '{engine}'")
+    # Reference tables are read once per run and shared by every year
+    ReferenceData.invalidate()
     va = VehicleAllocation()
-    tps = Topsis()
+    # A caller-owned Topsis keeps each year's normalised matrix for later rescoring
+    tps = Topsis() if tps is None else tps
+    # Stored per-group results are reused when a group's inputs have not changed since an earlier run
+    result_cache = GroupResultCache() if reuse_results else None
     eval = Evaluation()
     summarizer = Summary()
     sqlops = MySQLOperations()
@@ -22,28 +54,65 @@ def parallel_optimization(cost_weight, ce_weight, generations, population_size,
     ce = CarbonEmissions()
     connection_string = os.getenv('OUTPUT_STRING')
     
+    # A run with the same input data and parameters as a stored one is served from the run registry
+    run_id = None
+    # A traced run is always optimised, since stored runs carry no trace
+    registry = RunRegistry() if use_registry and trace_path is None else None
+    run_params = {
+        'driver': 'parallel_optimization', 'engine': engine, 'cost_weight': cost_weight, 'ce_weight': ce_weight,
+        'generations': generations, 'population_size': population_size, 'prev_years': prev_years,
+        'min_year': min_year, 'max_year': max_year, 'seed': seed, 'convergence': convergence,
+    }
+    if registry is not None:
+        run_id = RunRegistry.run_key(data_version=ReferenceData().version(), **run_params)
+        if registry.exists(run_id):
+            print(f"Run {run_id} found in the run registry")
+            published = {
+                'allocation': 'combined_multi_objective_fleet_allocation_eval',
+                'summary': 'multiobjective_summary_parallel',
+            }
+            # Only the pareto engine writes pareto_front; other runs leave it as it is
+            if engine == 'pareto':
+                published['pareto_front'] = 'pareto_front'
+            registry.publish(run_id, published)
+            sqlops.create_index('combined_multi_objective_fleet_allocation_eval', 'Operating Year')
+            return run_id
+    
     output_list = []
-    for year in range(min_year, max_year+1):
+    front_list = []
+    timing_list = []
+    trace_list = []
+    # One worker pool for all years; callers running the pipeline repeatedly can pass their own
+    owns_pool = pool is None
+    if owns_pool:
+        pool = OptimizerPool()
+    # Allocation and demand queries for the next prefetch_years years run in the background
+    # while the current year optimizes; only the carry-over merge waits for the previous year
+    prefetcher = ThreadPoolExecutor(max_workers=prefetch_years + 1)
+    prepared = {}
+    # Per-year allocation tables are written in the background; the next year uses the fleet kept in memory.
+    # persist_years=False skips only those tables
+    sink = AsyncOutputSink(enabled=persist_years)
+
+    def run_year(year: int, previous_fleet: pd.DataFrame) -> pd.DataFrame:
+        """Runs one operating year and returns its evaluated fleet, which the next year carries over"""
         print(f"Starting process for year {year}")
-        df = va.allocate_vehicles(year)
+        for ahead in range(year, min(year + prefetch_years, max_year) + 1):
+            if ahead not in prepared:
+                prepared[ahead] = prefetcher.submit(prepare_year, va, ahead)
+        df, demand_df = prepared.pop(year).result()
         # df.to_csv(f'data/output/tradeoff/topsis/allocation_output_{year}.csv', index=False)
         print(f"Allocated vehicles for year {year}")
-        if sqlops.table_exists(f'multi_objective_fleet_allocation_eval_{(year-1)}') == 1:
+        if previous_fleet is not None:
             print("Merging with previous year vehicles")
             
             # df1 = pd.read_csv(f"data/output/tradeoff/topsis/multi_objective_fleet_allocation_{(year-1)}.csv")
-            query = f"""SELECT * FROM multi_objective_fleet_allocation_eval_{(year-1)} WHERE `Operating Year` = {year-1}"""
-            vehicles_data, columns = sqlops.fetch_data(query, database='output')
-            df1 = pd.DataFrame(vehicles_data, columns=columns)
+            df1 = previous_fleet[previous_fleet['Operating Year'] == year-1].copy()
             df1['Operating Year'] = year
             merged_df = pd.concat([df1, df], ignore_index=True, sort=False)
             merged_df = merged_df[merged_df['Available Year'] > (year-prev_years)]
             merged_df.drop('demand', axis=1, inplace=True)
             ## UPDATING VALUES FOR OPERATING COSTS AND DEMAND COLUMNS
-            
-            query = f"""SELECT * FROM demand WHERE year = {year};"""
-            demand_data, columns = sqlops.fetch_data(query)
-            demand_df = pd.DataFrame(demand_data, columns=columns)
 
             df = pd.merge(
                 merged_df, 
@@ -82,8 +151,15 @@ def parallel_optimization(cost_weight, ce_weight, generations, population_size,
         } 
         tp_df.rename(columns=column_mapping, inplace=True) 
         print(f"Multiobjective Optimization...")
-        mo = MultiObjectiveFleetOptimizer(tp_df, ce_weight, cost_weight)
-        df = mo.get_optimized_results(year, generations, population_size)
+        # convergence holds ConvergenceMonitor settings, e.g. {'patience': 10}, to stop groups early
+        # With trace_path set the ga engine records per-generation progress, written there as Parquet at the end
+        mo = optimizer_class(tp_df, ce_weight, cost_weight, seed=seed, convergence=convergence,
+                             trace_generations=trace_path is not None)
+        df = mo.get_optimized_results(year, generations, population_size, pool=pool, result_cache=result_cache)
+        timing_list.append(pd.DataFrame(mo.group_timings))
+        trace_list.append(pd.DataFrame(mo.generation_trace))
+        if engine == 'pareto':
+            front_list.append(mo.front_frame())
 
         # df.to_csv(f'data/output/tradeoff/topsis/multi_objective_fleet_allocation_{year}.csv', index=False)
         print("Optimization done, output saved to file")
@@ -96,18 +172,50 @@ def parallel_optimization(cost_weight, ce_weight, generations, population_size,
         
         print(f"Optimization and Evaluation done for year {year}")
         print(f"Generating summary for year {year}")
-        summary_df = summarizer.summarize(df, year)
+        summarizer.summarize(df, year)
         # summary_df.to_csv('data/output/tradeoff/topsis/multiobjective_summary.csv')
         print("Summary generated")
         
-        engine = sqlops.create_sqlalchemy_engine(connection_string)
-        df.to_sql(f'multi_objective_fleet_allocation_eval_{year}', con=engine, if_exists='replace') 
-        summary_df.to_sql('multiobjective_summary_parallel', con=engine, if_exists='replace')
+        sink.write_tables([
+            (df, f'multi_objective_fleet_allocation_eval_{year}', 'replace', True),
+        ])
         print()
+        return df
+
+    try:
+        previous_fleet = None
+        for year in range(min_year, max_year+1):
+            previous_fleet = run_year(year, previous_fleet)
+    finally:
+        prefetcher.shutdown(cancel_futures=True)
+        sink.close()
+        if owns_pool:
+            pool.close()
     
     result = pd.concat(output_list)
-    engine = sqlops.create_sqlalchemy_engine(connection_string)
     
     # result.rename(columns=column_mapping, inplace=True)
-    result.to_sql(f'combined_multi_objective_fleet_allocation_eval', con=engine, if_exists='replace') 
+    # The summary goes out with the combined table, so persist_years=False still writes it
+    writes = [(result, 'combined_multi_objective_fleet_allocation_eval', 'replace', True),
+              (summarizer.summary_df, 'multiobjective_summary_parallel', 'replace', True)]
+    if timing_list:
+        # Per-group wall time next to the scheduling estimate, for calibrating it
+        writes.append((pd.concat(timing_list), 'group_timings', 'replace', False))
+    if front_list:
+        writes.append((pd.concat(front_list), 'pareto_front', 'replace', True))
+    sqlops.push_output_tables(writes)
+    # The dashboard pages query the combined table one year at a time
+    sqlops.create_index('combined_multi_objective_fleet_allocation_eval', 'Operating Year')
+    if trace_path is not None:
+        trace = pd.concat(trace_list, ignore_index=True)
+        if not trace.empty:
+            trace[['size', 'Distance_demand']] = trace[['size', 'Distance_demand']].astype('category')
+        os.makedirs(os.path.dirname(trace_path) or '.', exist_ok=True)
+        trace.to_parquet(trace_path, index=False)
+    if registry is not None:
+        frames = {'allocation': result, 'summary': summarizer.summary_df}
+        if front_list:
+            frames['pareto_front'] = pd.concat(front_list)
+        registry.store(run_id, run_params, frames)
+    return run_id 
     
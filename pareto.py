@@ -0,0 +1,75 @@
+import numpy as np
+from typing import Sequence
+
+def dominance_matrix(objectives: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Pareto dominance for minimisation objectives.
+    Args:
+        objectives (np.ndarray): (n_solutions, n_objectives) array.
+    Returns:
+        np.ndarray: boolean matrix where [i, j] is True if solution i dominates solution j.
+    """
+    n, n_objectives = objectives.shape
+    better_or_equal = np.ones((n, n), dtype=bool)
+    strictly_better = np.zeros((n, n), dtype=bool)
+    for k in range(n_objectives):
+        values = objectives[:, k]
+        better_or_equal &= values[:, None] <= values[None, :]
+        strictly_better |= values[:, None] < values[None, :]
+    return better_or_equal & strictly_better
+
+def fast_non_dominated_sort(objectives: Sequence) -> np.ndarray:
+    """
+    Deb's fast non-dominated sort. Domination counts and dominated sets are
+    computed once, then fronts are peeled by decrementing the counts of the
+    solutions dominated by the current front.
+    Args:
+        objectives: (n_solutions, n_objectives) values, all to be minimised.
+            Infeasible solutions can be passed as inf so they land in the last front.
+    Returns:
+        np.ndarray: front index (0 = non-dominated) for each solution.
+    """
+    objectives = np.asarray(objectives, dtype=float)
+    n = len(objectives)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    if objectives.ndim == 1:
+        objectives = objectives.reshape(n, 1)
+
+    dominates = dominance_matrix(objectives)
+    domination_count = dominates.sum(axis=0)
+    ranks = np.full(n, -1, dtype=np.int64)
+
+    rank = 0
+    front = np.flatnonzero(domination_count == 0)
+    while len(front) > 0:
+        ranks[front] = rank
+        domination_count = domination_count - dominates[front].sum(axis=0)
+        front = np.flatnonzero((domination_count == 0) & (ranks < 0))
+        rank += 1
+    return ranks
+
+def hypervolume_2d(points: Sequence, reference: Sequence) -> float:
+    """
+    Area dominated by a set of two-objective points (both minimised) and bounded
+    by the reference point. Points that do not dominate the reference add nothing.
+    Args:
+        points: (n_points, 2) objective values.
+        reference: (2,) reference point, worse than every point of interest.
+    Returns:
+        float: dominated area.
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    points = points[(points[:, 0] < reference[0]) & (points[:, 1] < reference[1])]
+    area = 0.0
+    best_second = reference[1]
+    # Sweep by the first objective; each point that improves the second adds a strip
+    for first, second in points[np.lexsort((points[:, 1], points[:, 0]))]:
+        if second < best_second:
+            area += (reference[0] - first) * (best_second - second)
+            best_second = second
+    return float(area)
+
+# Reference point for objectives scaled to [0, 1] by their bounds. It lies just
+# beyond the bounds so solutions that reach a bound still add area.
+SCALED_REFERENCE = (1.1, 1.1)
@@ -0,0 +1,96 @@
+import numpy as np
+from typing import Callable, Dict, List, Tuple
+
+# Share of population slots that distinct genotypes must fill before fresh immigrants are added
+IMMIGRANT_THRESHOLD = 0.2
+
+def genotype(solution: Dict) -> Tuple:
+    """Hashable key of a {vehicle_id: count} solution"""
+    return tuple(solution.values())
+
+def deduplicate(solutions: List[Dict], counts: List[int] = None) -> Tuple[List[Dict], List[int]]:
+    """
+    Unique genotypes in first-seen order, with the number of copies of each.
+    Args:
+        solutions (list): solutions, possibly repeated.
+        counts (list): copies each entry stands for, 1 each by default.
+    Returns:
+        Tuple[List[Dict], List[int]]: unique solutions and their summed counts.
+    """
+    index = {}
+    unique = []
+    multiplicity = []
+    for i, solution in enumerate(solutions):
+        key = genotype(solution)
+        count = 1 if counts is None else counts[i]
+        if key in index:
+            multiplicity[index[key]] += count
+        else:
+            index[key] = len(unique)
+            unique.append(solution)
+            multiplicity.append(count)
+    return unique, multiplicity
+
+def fill_survivors(ranked_solutions: List[Tuple[Dict, int]], copies: Dict, population_size: int,
+                   crowding_sort: Callable[[List[Dict]], List[Dict]]) -> Tuple[List[Dict], List[int]]:
+    """
+    NSGA-II survivor selection over unique genotypes. Fronts are taken in rank order
+    and each genotype keeps as many slots as it has copies; the front that does not
+    fit is ordered by crowding_sort and cut where the slots run out.
+    Args:
+        ranked_solutions (list): (solution, rank) pairs of unique genotypes, rank 0 best.
+        copies (dict): number of copies per genotype key.
+        population_size (int): slots to fill.
+        crowding_sort (callable): orders one front, preferred solutions first.
+    Returns:
+        Tuple[List[Dict], List[int]]: survivors and their multiplicities, summing to at most population_size.
+    """
+    survivors = []
+    multiplicity = []
+    filled = 0
+    current_rank = 0
+    last_rank = max((rank for _, rank in ranked_solutions), default=-1)
+
+    while filled < population_size and current_rank <= last_rank:
+        current_front = [sol for sol, rank in ranked_solutions if rank == current_rank]
+
+        if filled + sum(copies[genotype(sol)] for sol in current_front) > population_size:
+            current_front = crowding_sort(current_front)
+        for sol in current_front:
+            if filled >= population_size:
+                break
+            count = min(copies[genotype(sol)], population_size - filled)
+            survivors.append(sol)
+            multiplicity.append(count)
+            filled += count
+
+        current_rank += 1
+    return survivors, multiplicity
+
+def add_immigrants(survivors: List[Dict], multiplicity: List[int], population_size: int,
+                   generate: Callable[[int], List[Dict]],
+                   threshold: float = IMMIGRANT_THRESHOLD) -> Tuple[List[Dict], List[int]]:
+    """
+    Tops up a population whose distinct genotypes fill fewer than threshold of its
+    slots with fresh solutions. Each immigrant takes the slot of a copy of the most
+    duplicated survivor; immigrants repeating a present genotype are dropped.
+    Args:
+        survivors (list): unique genotypes.
+        multiplicity (list): copies of each survivor.
+        population_size (int): population slots.
+        generate (callable): returns n fresh solutions.
+        threshold (float): share of slots distinct genotypes must fill.
+    Returns:
+        Tuple[List[Dict], List[int]]: population and the multiplicity of each genotype.
+    """
+    target = int(np.ceil(threshold * population_size))
+    if len(survivors) >= target:
+        return survivors, multiplicity
+    immigrants = generate(target - len(survivors))
+    population, multiplicity = deduplicate(survivors + immigrants, multiplicity + [0] * len(immigrants))
+    multiplicity = [max(count, 1) for count in multiplicity]
+    excess = sum(multiplicity) - population_size
+    while excess > 0 and max(multiplicity) > 1:
+        multiplicity[multiplicity.index(max(multiplicity))] -= 1
+        excess -= 1
+    return population, multiplicity
@@ -1,17 +1,16 @@
 import pandas as pd
 from main_tradeoff_topsis_parallelize import parallel_optimization
+from tradeoff_topsis_parallelize import OptimizerPool
 from utilities.my_sql_operations import MySQLOperations
 import os
 import time
 
-def run_multiple_optimizations(n_runs=50):
+def run_multiple_optimizations(n_runs=50, seed=0):
     cost_weight, carbon_emissions_weight = 0.5, 0.5
     generations, population_size = 50, 100
     prev_years, min_year, max_year = 7, 2023, 2038
 
     sqlops = MySQLOperations()
-    connection_string = os.getenv('OUTPUT_STRING')
-    engine = sqlops.create_sqlalchemy_engine(connection_string)
 
     # DataFrame to accumulate summary results
     all_runs_df = pd.DataFrame()
@@ -19,35 +18,38 @@ def run_multiple_optimizations(n_runs=50):
     # DataFrame to accumulate timing info
     run_times = []
 
-    for run in range(n_runs):
-        print(f"\n🚀 Starting run {run+1}/{n_runs}")
-        start_time = time.time()
-        parallel_optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year)
-        end_time = time.time()
+    # Workers are started once and reused by every run
+    with OptimizerPool() as pool:
+        for run in range(n_runs):
+            print(f"\n🚀 Starting run {run+1}/{n_runs}")
+            start_time = time.time()
+            # Run r uses seed + r, so the whole experiment can be repeated exactly
+            parallel_optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year, pool=pool, seed=seed + run)
+            end_time = time.time()
 
-        duration = end_time - start_time
-        print(f"✅ Run {run+1} completed in {duration:.2f} seconds")
+            duration = end_time - start_time
+            print(f"✅ Run {run+1} completed in {duration:.2f} seconds")
 
-        # Save time for this run
-        run_times.append({'Run': run + 1, 'ExecutionTimeSeconds': round(duration, 2)})
+            # Save time for this run
+            run_times.append({'Run': run + 1, 'ExecutionTimeSeconds': round(duration, 2)})
 
-        # Fetch the summary table from SQL after each run
-        summary_df = pd.read_sql('topsis_multiobjective_summary', con=engine)
+            # Fetch the summary table from SQL after each run
+            summary_df = sqlops.fetch_output_data('topsis_multiobjective_summary')
 
-        # Add a run index to track runs
-        summary_df['run'] = run + 1
-        all_runs_df = pd.concat([all_runs_df, summary_df], ignore_index=True)
+            # Add a run index to track runs
+            summary_df['run'] = run + 1
+            all_runs_df = pd.concat([all_runs_df, summary_df], ignore_index=True)
 
     # Calculate mean TotalCost and TotalCarbonEmissions for each year
     mean_df = all_runs_df.groupby('Year')[['TotalCost', 'TotalCarbonEmissions']].mean().reset_index()
 
     # Store averaged results
-    mean_df.to_sql('topsis_multiobjective_summary_avg', con=engine, if_exists='replace', index=False)
+    sqlops.push_output_data(mean_df, 'topsis_multiobjective_summary_avg', index=False)
     print("\n📊 Averaged results stored in SQL table: `topsis_multiobjective_summary_avg`")
 
     # Store run time data
     run_times_df = pd.DataFrame(run_times)
-    run_times_df.to_sql('parallel_topsis_run_times', con=engine, if_exists='replace', index=False)
+    sqlops.push_output_data(run_times_df, 'parallel_topsis_run_times', index=False)
     print("\n⏱️ Execution times stored in SQL table: `parallel_topsis_run_times`")
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def synthetic_fleet_data(seed: int = 0, n_groups: int = 6, n_types: int = 8) -> pd.DataFrame:
+    """
+    TOPSIS-scored rows for a few size-distance groups in which feasibility is tight:
+    one long-range vehicle type and several short-range ones, with the demand just
+    below what max_vehicles long-range vehicles cover.
+    """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for g in range(n_groups):
+        size, distance = f"S{g // 4 + 1}", f"D{g % 4 + 1}"
+        max_vehicles = int(rng.integers(3, 9))
+        long_range = 100000.0
+        demand = max_vehicles * long_range - float(rng.integers(1000, 20000))
+        for t in range(n_types):
+            yearly_range = long_range if t == 0 else float(rng.integers(15000, 40000))
+            cost = float(rng.integers(40000, 120000))
+            fuel_costs_per_km = float(rng.uniform(0.05, 0.4))
+            rows.append({
+                'Allocation': f"V{g}_{t}", 'Operating Year': 2023, 'size': size, 'Distance_demand': distance,
+                'demand': demand, 'id': f"V{g}_{t}", 'vehicle': f"type_{t}", 'Available Year': 2023,
+                'cost': cost, 'a_cost': cost, 'yearly_range': yearly_range, 'Distance_vehicle': distance,
+                'fuel': 'Electricity' if t % 2 else 'Diesel', 'consumption_unitfuel_per_km': float(rng.uniform(0.1, 1)),
+                'carbon_emissions_per_km': float(rng.uniform(0, 0.3)), 'insurance_cost': cost * 0.05,
+                'maintenance_cost': cost * 0.01, 'fuel_costs_per_km': fuel_costs_per_km,
+                'Operating_Cost': cost * 0.06 + fuel_costs_per_km * yearly_range,
+                'Topsis_Score': float(rng.uniform()), 'Rank': float(rng.integers(1, n_types + 1)),
+            })
+    return pd.DataFrame(rows)
+
+
+@pytest.fixture
+def fleet_data():
+    return synthetic_fleet_data()
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from convergence import ConvergenceMonitor
+from tradeoff_vectorized import VectorizedFleetOptimizer
+from conftest import synthetic_fleet_data
+
+
+def test_patience_counts_from_first_feasible_generation():
+    monitor = ConvergenceMonitor(patience=3)
+    assert not any(monitor.update(float('-inf')) for _ in range(10))
+    assert not monitor.update(0.5)
+    assert not monitor.update(0.5)
+    assert not monitor.update(0.5)
+    assert monitor.update(0.5)
+    assert monitor.report() == {"Generations_Used": 14, "Stop_Reason": "stagnation"}
+
+
+def test_zero_hypervolume_does_not_stop():
+    monitor = ConvergenceMonitor(hypervolume_tolerance=1e-4, hypervolume_window=2)
+    assert not any(monitor.update(float('-inf'), hypervolume=0.0) for _ in range(10))
+    assert not monitor.update(0.5, hypervolume=0.3)
+    assert not monitor.update(0.5, hypervolume=0.3)
+    assert monitor.update(0.5, hypervolume=0.3)
+    assert monitor.report()["Stop_Reason"] == "hypervolume"
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_early_stopping_keeps_every_fleet_found_without_it(seed):
+    data = synthetic_fleet_data(seed)
+    full = VectorizedFleetOptimizer(data)
+    stopped = VectorizedFleetOptimizer(data, convergence={'patience': 5, 'hypervolume_tolerance': 1e-4})
+    for size_distance in full.vehicles_by_size_distance:
+        expected = full.optimize(size_distance, 40, 20, rng=np.random.default_rng(seed))
+        found = stopped.optimize(size_distance, 40, 20, rng=np.random.default_rng(seed))
+        assert (found is None) == (expected is None)
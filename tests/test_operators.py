@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from tradeoff_exact import ExactFleetOptimizer
+from tradeoff_topsis_parallelize import MultiObjectiveFleetOptimizer
+from tradeoff_vectorized import VectorizedFleetOptimizer
+from conftest import synthetic_fleet_data
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_repair_projects_any_count_vector_onto_feasible_region(seed):
+    optimizer = MultiObjectiveFleetOptimizer(synthetic_fleet_data(seed))
+    rng = np.random.default_rng(seed)
+    for context in optimizer.group_contexts.values():
+        for _ in range(100):
+            assert context.is_feasible(context.sample_feasible(rng))
+            counts = rng.integers(-2, context.max_vehicles + 3, context.n_types)
+            assert context.is_feasible(context.repair(counts, rng))
+        feasible = context.sample_feasible(rng)
+        assert (context.repair(feasible, rng) == feasible).all()
+
+
+def test_ga_operators_only_produce_feasible_fleets(fleet_data):
+    optimizer = MultiObjectiveFleetOptimizer(fleet_data)
+    rng = np.random.default_rng(0)
+    for size_distance, context in optimizer.group_contexts.items():
+        population = optimizer.generate_initial_population(size_distance, rng, 20)
+        for _ in range(50):
+            child1, child2 = optimizer.crossover(population[0], population[1], size_distance, rng)
+            mutated = optimizer.mutate(child1, size_distance, rng)
+            population = [mutated, child2] + population
+        assert all(context.is_feasible(context.to_vector(solution)) for solution in population)
+
+
+def assert_feasible_rows(rows, context):
+    assert (rows >= 0).all()
+    assert (rows.sum(axis=1) > 0).all()
+    assert (rows.sum(axis=1) <= context.max_vehicles).all()
+    assert (rows @ context.yearly_range >= context.demand).all()
+
+
+def test_vectorized_operators_only_produce_feasible_rows(fleet_data):
+    optimizer = VectorizedFleetOptimizer(fleet_data)
+    rng = np.random.default_rng(0)
+    for context in optimizer.group_contexts.values():
+        population = optimizer.generate_population_matrix(context, 20, rng)
+        assert_feasible_rows(population, context)
+        for _ in range(30):
+            children1, children2 = optimizer.crossover_matrix(population[::2], population[1::2], context, rng)
+            mutated = optimizer.mutate_matrix(np.vstack([children1, children2]), context, rng, mutation_rate=0.5)
+            for rows in (children1, children2, mutated):
+                assert_feasible_rows(rows, context)
+            population = mutated
+
+
+def test_negative_counts_are_not_feasible(fleet_data):
+    context = next(iter(VectorizedFleetOptimizer(fleet_data).group_contexts.values()))
+    counts = np.zeros(context.n_types, dtype=np.int64)
+    counts[0] = context.max_vehicles
+    assert context.is_feasible(counts)
+    # Swap in a longer-range vehicle for a "removed" shorter-range one: every other check passes
+    shorter, longer = np.argsort(context.yearly_range[1:])[[0, -1]] + 1
+    counts[shorter] = -1
+    counts[longer] = 1
+    assert counts.sum() == context.max_vehicles and counts @ context.yearly_range >= context.demand
+    assert not context.is_feasible(counts)
+    assert not context.is_feasible(counts[None, :]).any()
+
+
+def test_vectorized_results_respect_max_vehicles(fleet_data):
+    optimizer = VectorizedFleetOptimizer(fleet_data, seed=0)
+    result = optimizer.get_optimized_results(2023, 30, 20)
+    assert (result['No_of_vehicles'] >= 0).all()
+    fleets = result.groupby(['size', 'Distance_demand']).agg(
+        vehicles=('No_of_vehicles', 'sum'), max_vehicles=('Max Vehicles', 'first'))
+    assert len(fleets) == len(optimizer.vehicles_by_size_distance)
+    assert (fleets['vehicles'] > 0).all()
+    assert (fleets['vehicles'] <= fleets['max_vehicles']).all()
+
+
+@pytest.mark.parametrize("optimizer_class", [MultiObjectiveFleetOptimizer, VectorizedFleetOptimizer, ExactFleetOptimizer])
+@pytest.mark.parametrize("seed", range(3))
+def test_every_group_gets_a_fleet(optimizer_class, seed):
+    optimizer = optimizer_class(synthetic_fleet_data(seed))
+    for size_distance in optimizer.vehicles_by_size_distance:
+        assert optimizer.optimize(size_distance, 10, 10, rng=np.random.default_rng(seed)) is not None
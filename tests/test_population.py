@@ -0,0 +1,64 @@
+import numpy as np
+
+from population import add_immigrants, deduplicate, fill_survivors, genotype
+
+
+def fleet(*counts):
+    return {f"V{i}": count for i, count in enumerate(counts)}
+
+
+def test_deduplicate_sums_copies_in_first_seen_order():
+    unique, multiplicity = deduplicate([fleet(1, 0), fleet(0, 1), fleet(1, 0)], [2, 1, 3])
+    assert unique == [fleet(1, 0), fleet(0, 1)]
+    assert multiplicity == [5, 1]
+
+
+def test_survivors_keep_their_copies_and_fill_population():
+    ranked = [(fleet(1, 0), 0), (fleet(0, 1), 0), (fleet(1, 1), 1), (fleet(2, 0), 1)]
+    copies = {genotype(fleet(1, 0)): 3, genotype(fleet(0, 1)): 2, genotype(fleet(1, 1)): 4, genotype(fleet(2, 0)): 1}
+    survivors, multiplicity = fill_survivors(ranked, copies, 6, lambda front: front[::-1])
+    # The rank-1 front overflows and is cut after its crowding order
+    assert survivors == [fleet(1, 0), fleet(0, 1), fleet(2, 0)]
+    assert multiplicity == [3, 2, 1]
+
+
+def test_crowding_sort_is_only_used_for_the_overflowing_front():
+    sorted_fronts = []
+    ranked = [(fleet(1, 0), 0), (fleet(0, 1), 1)]
+    copies = {genotype(fleet(1, 0)): 1, genotype(fleet(0, 1)): 1}
+    fill_survivors(ranked, copies, 5, lambda front: sorted_fronts.append(front) or front)
+    assert sorted_fronts == []
+
+
+def test_immigrants_replace_surplus_copies():
+    survivors, multiplicity = [fleet(1, 0)], [10]
+    fresh = iter([fleet(0, 1), fleet(1, 0), fleet(1, 1), fleet(2, 0)])
+    population, multiplicity = add_immigrants(survivors, multiplicity, 10,
+                                              lambda n: [next(fresh) for _ in range(n)], threshold=0.4)
+    # The immigrant repeating the survivor is dropped; the others each take one of its copies
+    assert population == [fleet(1, 0), fleet(0, 1), fleet(1, 1)]
+    assert multiplicity == [8, 1, 1]
+    assert sum(multiplicity) == 10
+
+
+def test_no_immigrants_while_population_is_diverse():
+    survivors, multiplicity = [fleet(1, 0), fleet(0, 1)], [3, 2]
+    assert add_immigrants(survivors, multiplicity, 5, lambda n: [fleet(1, 1)] * n, threshold=0.4) == (survivors, multiplicity)
+
+
+def test_multiplicities_sum_to_population_size():
+    rng = np.random.default_rng(0)
+    population_size = 20
+    for _ in range(200):
+        genotypes = [fleet(*rng.integers(0, 3, 3)) for _ in range(int(rng.integers(1, 30)))]
+        unique, counts = deduplicate(genotypes, list(rng.integers(1, 6, len(genotypes))))
+        ranked = [(sol, int(rng.integers(0, 4))) for sol in unique]
+        survivors, multiplicity = fill_survivors(ranked, dict(zip(map(genotype, unique), counts)),
+                                                 population_size, lambda front: front)
+        population, multiplicity = add_immigrants(survivors, multiplicity, population_size,
+                                                  lambda n: [fleet(*rng.integers(3, 6, 3)) for _ in range(n)])
+        assert sum(multiplicity) <= population_size
+        if sum(counts) >= population_size:
+            assert sum(multiplicity) == population_size
+        assert len({genotype(sol) for sol in population}) == len(population)
+        assert min(multiplicity) >= 1
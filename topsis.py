@@ -4,7 +4,11 @@ import pandas as pd
 
 class Topsis:
     def __init__(self):
-        pass
+        self.criteria_columns = ['carbon_emissions_per_km','Operating_Cost', 'cost']
+        # Define impact directions (both to be minimized)
+        self.impacts = ['-', '-', '-']
+        # Grouped, normalised decision matrix per year, reused by rescore
+        self.normalised = {}
     
     def topsis_algo(self, df, criteria_columns, weights, impacts):
         
@@ -49,36 +53,64 @@ class Topsis:
         # if df == None:             
         #     df = pd.read_csv(f'data/output/allocation_output_{year}.csv', index_col=False)
         df.reset_index(drop=True, inplace=True)
-        
-        # Get unique combinations of Size and Distance_x
-        combinations = df.groupby(['size', 'Distance_demand'])
+        data, groups, normalized_matrix = self._normalise(year, df)
+        return self._score(data, groups, normalized_matrix, weights)
 
-        # Store results
-        results = []
+    def rescore(self, year, weights):
+        """
+        Scores the decision matrix last passed to apply_topsis for this year with
+        new weights, reusing its normalisation.
+        Args:
+            year (int): operating year given to apply_topsis.
+            weights (list): criteria weights, in the apply_topsis order.
+        Returns:
+            pd.DataFrame: same rows and columns as apply_topsis would return.
+        """
+        if year not in self.normalised:
+            raise ValueError(f"No TOPSIS input cached for year {year}, run apply_topsis first")
+        data, groups, normalized_matrix = self.normalised[year]
+        return self._score(data, groups, normalized_matrix, weights)
 
-        # Perform TOPSIS for each combination
-        for (size, distance), group in combinations:
-            # Define criteria columns
-            criteria_columns = ['carbon_emissions_per_km','Operating_Cost', 'cost']
-            
-            # Define weights (equal weights in this case)
-            weights = weights
-            
-            # Define impact directions (both to be minimized)
-            impacts = ['-', '-', '-']
-            
-            # Perform TOPSIS
-            result = self.topsis_algo(group, criteria_columns, weights, impacts)
-            
-            # Add size and distance info to results
-            # result['Size'] = size
-            # result['Distance'] = distance
-            
-            results.append(result)
+    def _normalise(self, year, df):
+        # Define criteria columns
+        criteria_columns = self.criteria_columns
 
-        # Combine all results
-        final_results = pd.concat(results)
-        
+        # Same steps as topsis_algo, computed for every (size, Distance_demand) group at once
+        group_keys = ['size', 'Distance_demand']
+        group_ids = df.groupby(group_keys, sort=True).ngroup()
+        grouped_rows = group_ids[group_ids >= 0].sort_values(kind='stable').index
+        data = df.loc[grouped_rows].copy()
+        groups = group_ids[grouped_rows]
+
+        criteria = data[criteria_columns]
+        # Rows are contiguous per group, so each group's vector norms are one np.add.reduceat
+        # over the segment starts; missing values count as zero, as in Series.sum
+        group_sizes = groups.value_counts(sort=False).sort_index().to_numpy()
+        bounds = np.concatenate(([0], np.cumsum(group_sizes)))
+        squares = np.nan_to_num(criteria.to_numpy(dtype=float) ** 2)
+        group_norms = np.sqrt(np.add.reduceat(squares, bounds[:-1], axis=0))
+        norms = pd.DataFrame(np.repeat(group_norms, group_sizes, axis=0), index=data.index, columns=criteria_columns)
+        normalized_matrix = criteria / norms
+
+        self.normalised[year] = (data, groups, normalized_matrix)
+        return data, groups, normalized_matrix
+
+    def _score(self, data, groups, normalized_matrix, weights):
+        criteria_columns = self.criteria_columns
+        impacts = self.impacts
+
+        weighted_matrix = normalized_matrix * weights
+        group_max = weighted_matrix.groupby(groups).transform('max')
+        group_min = weighted_matrix.groupby(groups).transform('min')
+
+        ideal_best = pd.DataFrame({col: group_max[col] if impact == '+' else group_min[col] for col, impact in zip(criteria_columns, impacts)})
+        ideal_worst = pd.DataFrame({col: group_min[col] if impact == '+' else group_max[col] for col, impact in zip(criteria_columns, impacts)})
+
+        distance_best = np.sqrt(((weighted_matrix - ideal_best) ** 2).sum(axis=1))
+        distance_worst = np.sqrt(((weighted_matrix - ideal_worst) ** 2).sum(axis=1))
+
+        scored = data.copy()
+        scored['Topsis_Score'] = distance_worst / (distance_best + distance_worst)
+        scored['Rank'] = scored['Topsis_Score'].groupby(groups).rank(method='dense', ascending=True)
 
-        return final_results
-    
\ No newline at end of file
+        return scored
@@ -0,0 +1,123 @@
+import pandas as pd
+import numpy as np
+import math
+import time
+from typing import List, Dict, Tuple
+from group_context import GroupContext
+from utilities.group_cache import GroupResultCache
+from tradeoff_topsis_parallelize import MultiObjectiveFleetOptimizer
+
+class ExactFleetOptimizer(MultiObjectiveFleetOptimizer):
+    """
+    Solves every size-distance subproblem exactly instead of running the GA.
+
+    A feasible solution needs capacity >= demand with at most max_vehicles vehicles,
+    so its vehicle count N lies between ceil(demand / max yearly range) and
+    max_vehicles. For a fixed N the scalarised fitness is separable per vehicle
+    type, and a dynamic program over vehicle types with (value, capacity)
+    dominance pruning finds the optimum deterministically.
+    """
+    def _type_values(self, context: GroupContext, num_vehicles: int, total_vehicles: int) -> np.ndarray:
+        """Contribution of num_vehicles of each type to the fitness of a solution with total_vehicles vehicles"""
+        if num_vehicles == 0:
+            return np.zeros(context.n_types)
+
+        demand = float(context.demand)
+        cost = num_vehicles * context.fixed_cost + context.fuel_costs_per_km * (demand / num_vehicles)
+        emissions = context.carbon_emissions_per_km * (demand / num_vehicles) * num_vehicles
+
+        cost_coefficient = self.cost_weight / context.max_possible_cost if context.max_possible_cost > 0 else 0
+        emissions_coefficient = self.emission_weight / context.max_possible_emissions if context.max_possible_emissions > 0 else 0
+        return (
+            - cost_coefficient * cost
+            - emissions_coefficient * emissions
+            + num_vehicles * context.rank / total_vehicles
+        )
+
+    def _solve_fixed_total(self, context: GroupContext, total_vehicles: int):
+        """Best (value, counts) using exactly total_vehicles vehicles, or None if demand cannot be met"""
+        demand = float(context.demand)
+        n_types = context.n_types
+        values = [self._type_values(context, x, total_vehicles) for x in range(total_vehicles + 1)]
+
+        # Best capacity still reachable from type j onwards, for bound pruning
+        remaining_range = np.maximum.accumulate(context.yearly_range[::-1])[::-1]
+
+        # states[n] holds non-dominated labels (value, capacity, counts) using n vehicles
+        states = {0: [(0.0, 0.0, ())]}
+        for j in range(n_types):
+            best_remaining = remaining_range[j + 1] if j + 1 < n_types else 0.0
+            new_states = {}
+            for used, labels in states.items():
+                for x in range(total_vehicles - used + 1):
+                    n = used + x
+                    value_x = values[x][j]
+                    for value, capacity, counts in labels:
+                        new_capacity = capacity + x * context.yearly_range[j]
+                        if new_capacity + (total_vehicles - n) * best_remaining < demand:
+                            continue
+                        new_states.setdefault(n, []).append((value + value_x, new_capacity, counts + (x,)))
+            states = {n: self._prune_labels(labels) for n, labels in new_states.items()}
+
+        final = [label for label in states.get(total_vehicles, []) if label[1] >= demand]
+        if not final:
+            return None
+        value, _, counts = max(final, key=lambda label: label[0])
+        return value, np.array(counts, dtype=np.int64)
+
+    @staticmethod
+    def _prune_labels(labels: List[Tuple]) -> List[Tuple]:
+        """Drops labels with both lower value and lower capacity than another label"""
+        labels = sorted(labels, key=lambda label: (-label[1], -label[0]))
+        kept = []
+        best_value = float('-inf')
+        for label in labels:
+            if label[0] > best_value:
+                kept.append(label)
+                best_value = label[0]
+        return kept
+
+    def solve_group(self, size_distance: Tuple):
+        """
+        Exact optimum of one size-distance group.
+        Returns:
+            np.ndarray: vehicle counts in GroupContext order, or None if the group is infeasible.
+        """
+        context = self.group_contexts[size_distance]
+        max_range = context.yearly_range.max() if context.n_types else 0
+        if context.max_vehicles <= 0 or max_range <= 0:
+            return None
+
+        min_vehicles = max(1, math.ceil(float(context.demand) / max_range))
+        best = None
+        for total_vehicles in range(min_vehicles, context.max_vehicles + 1):
+            solved = self._solve_fixed_total(context, total_vehicles)
+            if solved is not None and (best is None or solved[0] > best[0]):
+                best = solved
+        return None if best is None else best[1]
+
+    def optimize(self, size_distance: Tuple, generations: int = None, population_size: int = None,
+                 rng: np.random.Generator = None) -> Dict:
+        counts = self.solve_group(size_distance)
+        if counts is None:
+            return None
+        return self.group_contexts[size_distance].to_solution(counts)
+
+    def get_optimized_results(self, year, generations: int = None, population_size: int = None, pool=None,
+                              result_cache: GroupResultCache = None) -> pd.DataFrame:
+        # Exact solves are fast enough that a process pool costs more than it saves
+        fingerprints, cached = self._cached_group_results(result_cache, generations, population_size)
+        results = []
+        self.group_timings = []
+        for size_distance in self.vehicles_by_size_distance.keys():
+            if size_distance in cached:
+                results.extend(cached[size_distance])
+                continue
+            start = time.perf_counter()
+            rows = self._process_size_distance(size_distance, generations, population_size)
+            elapsed = time.perf_counter() - start
+            results.extend(rows)
+            if result_cache is not None:
+                result_cache.put(fingerprints[size_distance], rows)
+            self.group_timings.append({"Operating Year": year, **self._group_timing(size_distance, generations, population_size, elapsed)})
+        return pd.DataFrame(results)
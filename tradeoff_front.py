@@ -0,0 +1,133 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Tuple
+from tradeoff_exact import ExactFleetOptimizer
+
+FRONT_KEYS = ['Operating Year', 'size', 'Distance_demand']
+FRONT_COLUMNS = ['Front_Point', 'Front_Cost', 'Front_CE', 'Cost_Score', 'CE_Score', 'Topsis_Mean']
+
+class ParetoFrontOptimizer(ExactFleetOptimizer):
+    """
+    Computes, once per size-distance group, every solution that is optimal for
+    some cost/emission weight pair, using a dichotomic weight sweep over the
+    exact solver. The best solution for any weights is then picked from the
+    stored front without re-solving.
+    """
+    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5, seed: int = None,
+                 convergence: Dict = None, trace_generations: bool = False, groups: Dict = None):
+        super().__init__(data, emission_weight, cost_weight, seed, convergence, trace_generations, groups)
+        self.fronts = {}
+
+    def set_weights(self, emission_weight: float, cost_weight: float):
+        total_weight = emission_weight + cost_weight
+        self.emission_weight = emission_weight / total_weight
+        self.cost_weight = cost_weight / total_weight
+
+    def _front_point(self, size_distance: Tuple, counts: np.ndarray) -> Dict:
+        context = self.group_contexts[size_distance]
+        solution = context.to_solution(counts)
+        cost, emissions, _, weighted_topsis = self.evaluate_solution(solution, size_distance)
+        return {
+            'solution': solution,
+            'cost': cost,
+            'emissions': emissions,
+            'cost_score': 1 - (cost / context.max_possible_cost if context.max_possible_cost > 0 else 0),
+            'emissions_score': 1 - (emissions / context.max_possible_emissions if context.max_possible_emissions > 0 else 0),
+            'topsis_mean': weighted_topsis / sum(solution.values()),
+        }
+
+    @staticmethod
+    def _scalarise(point: Dict, cost_share: float) -> float:
+        """Same score as fitness_function for a feasible solution with weights (cost_share, 1 - cost_share)"""
+        return cost_share * point['cost_score'] + (1 - cost_share) * point['emissions_score'] + point['topsis_mean']
+
+    def _solve_at(self, size_distance: Tuple, cost_share: float) -> Dict:
+        weights = (self.emission_weight, self.cost_weight)
+        self.emission_weight, self.cost_weight = 1 - cost_share, cost_share
+        try:
+            counts = self.solve_group(size_distance)
+        finally:
+            self.emission_weight, self.cost_weight = weights
+        return None if counts is None else self._front_point(size_distance, counts)
+
+    def compute_front(self, size_distance: Tuple) -> List[Dict]:
+        """
+        Supported Pareto front of one group, sorted by cost.
+        Between two front points the weight at which they score equally is
+        solved exactly; a better solution there is a new front point and both
+        halves are searched again, otherwise the interval is complete.
+        """
+        low = self._solve_at(size_distance, 0.0)
+        if low is None:
+            self.fronts[size_distance] = []
+            return []
+        high = self._solve_at(size_distance, 1.0)
+
+        points = {tuple(low['solution'].values()): low, tuple(high['solution'].values()): high}
+        intervals = [(0.0, low, 1.0, high)]
+        while intervals:
+            lower_share, a, upper_share, b = intervals.pop()
+            if a['solution'] == b['solution']:
+                continue
+            denominator = (a['cost_score'] - a['emissions_score']) - (b['cost_score'] - b['emissions_score'])
+            if denominator == 0:
+                continue
+            share = (b['emissions_score'] + b['topsis_mean'] - a['emissions_score'] - a['topsis_mean']) / denominator
+            if not lower_share < share < upper_share:
+                continue
+
+            c = self._solve_at(size_distance, share)
+            if self._scalarise(c, share) <= self._scalarise(a, share) + 1e-9:
+                continue
+            points[tuple(c['solution'].values())] = c
+            intervals.append((lower_share, a, share, c))
+            intervals.append((share, c, upper_share, b))
+
+        front = sorted(points.values(), key=lambda point: (point['cost'], point['emissions']))
+        self.fronts[size_distance] = front
+        return front
+
+    def optimize(self, size_distance: Tuple, generations: int = None, population_size: int = None,
+                 rng: np.random.Generator = None) -> Dict:
+        if size_distance not in self.fronts:
+            self.compute_front(size_distance)
+        front = self.fronts[size_distance]
+        if not front:
+            return None
+        return max(front, key=lambda point: self._scalarise(point, self.cost_weight))['solution']
+
+    def front_frame(self) -> pd.DataFrame:
+        """
+        Stored fronts in the get_optimized_results schema, one block of rows per
+        front point, with the point's objectives and normalised scores.
+        """
+        rows = []
+        for size_distance in self.vehicles_by_size_distance.keys():
+            if size_distance not in self.fronts:
+                self.compute_front(size_distance)
+            for i, point in enumerate(self.fronts[size_distance]):
+                for row in self._solution_rows(size_distance, point['solution']):
+                    row.update({
+                        'Front_Point': i,
+                        'Front_Cost': point['cost'],
+                        'Front_CE': point['emissions'],
+                        'Cost_Score': point['cost_score'],
+                        'CE_Score': point['emissions_score'],
+                        'Topsis_Mean': point['topsis_mean'],
+                    })
+                    rows.append(row)
+        return pd.DataFrame(rows)
+
+def select_from_front(front_df: pd.DataFrame, cost_weight: float, ce_weight: float) -> pd.DataFrame:
+    """
+    Picks the best stored front point of every (year, size, distance) group for
+    the given weights and returns its rows in the get_optimized_results schema.
+    Later years keep the fleet carried over in the run that stored the fronts.
+    """
+    cost_share = cost_weight / (cost_weight + ce_weight)
+    points = front_df.drop_duplicates(FRONT_KEYS + ['Front_Point']).copy()
+    points['Score'] = cost_share * points['Cost_Score'] + (1 - cost_share) * points['CE_Score'] + points['Topsis_Mean']
+
+    best = points.loc[points.groupby(FRONT_KEYS, sort=False)['Score'].idxmax(), FRONT_KEYS + ['Front_Point']]
+    selected = front_df.merge(best, on=FRONT_KEYS + ['Front_Point'], how='inner')
+    return selected.drop(columns=FRONT_COLUMNS)
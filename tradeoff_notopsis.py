@@ -1,22 +1,32 @@
 import pandas as pd
 import numpy as np
 import math
-import random 
 from typing import List, Dict, Tuple
+from pareto import fast_non_dominated_sort
+from utilities.objective_cache import ObjectiveCache
+from group_context import GroupContext, group_seed_sequences
 from pprint import pprint
 
 class MultiObjectiveFleetOptimizer:
-    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5):
+    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5, seed: int = None):
         self.data = data
+        # Run seed; each group draws from its own stream spawned from it (see group_seeds)
+        self.seed = seed
         self.emission_weight = emission_weight
         self.cost_weight = cost_weight
         self.vehicles_by_size_distance = self._group_vehicles()
         self.max_vehicles_by_group = self._calculate_max_vehicles()
+        self.group_contexts = self._build_group_contexts()
+        self.objective_cache = ObjectiveCache()
         
         total_weight = emission_weight + cost_weight
         self.emission_weight = emission_weight / total_weight
         self.cost_weight = cost_weight / total_weight
     
+    def group_seeds(self, year: int) -> Dict:
+        """One SeedSequence per group for the year, keyed by the group itself (see group_seed_sequences)"""
+        return group_seed_sequences(self.seed, year, self.vehicles_by_size_distance.keys())
+
     def _group_vehicles(self) -> Dict:
         groups = {}
         for _, row in self.data.iterrows():
@@ -60,6 +70,13 @@ class MultiObjectiveFleetOptimizer:
         
         return max_vehicles
 
+    def _build_group_contexts(self) -> Dict:
+        return {
+            key: GroupContext(key, vehicles, self.max_vehicles_by_group[key],
+                              self.calculate_total_cost, self.calculate_total_emissions)
+            for key, vehicles in self.vehicles_by_size_distance.items()
+        }
+
     def is_valid_solution(self, solution: Dict, size_distance: Tuple) -> bool:
         if sum(solution.values()) == 0:
             return False
@@ -82,7 +99,28 @@ class MultiObjectiveFleetOptimizer:
         
         return vehicle['carbon_emissions_per_km'] * distance_per_vehicle * num_vehicles
 
-    def generate_initial_population(self, size_distance: Tuple, population_size: int = 50) -> List[Dict]:
+    def evaluate_solution(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float]:
+        """Total cost, emissions and capacity, computed once per genotype"""
+        key = (size_distance, tuple(solution.values()))
+        return self.objective_cache.get_or_compute(key, lambda: self._compute_objectives(solution, size_distance))
+
+    def _compute_objectives(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float]:
+        vehicle_dict = self.group_contexts[size_distance].vehicle_dict
+
+        total_cost = 0
+        total_emissions = 0
+        total_capacity = 0
+        
+        for vehicle_type, num_vehicles in solution.items():
+            if num_vehicles > 0:
+                vehicle = vehicle_dict[vehicle_type]
+                total_cost += self.calculate_total_cost(num_vehicles, vehicle)
+                total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
+                total_capacity += num_vehicles * vehicle['Yearly range (km)']
+        
+        return total_cost, total_emissions, total_capacity
+
+    def generate_initial_population(self, size_distance: Tuple, rng: np.random.Generator, population_size: int = 50) -> List[Dict]:
 
         population = []
         vehicles = self.vehicles_by_size_distance[size_distance]
@@ -100,13 +138,13 @@ class MultiObjectiveFleetOptimizer:
             remaining_vehicles = max_vehicles
             
             while remaining_vehicles > 0:
-                selected_idx = np.random.choice(range(len(vehicle_types)))
+                selected_idx = rng.choice(len(vehicle_types))
                 selected_type = vehicle_types[selected_idx]
                 
-                if solution[selected_type] < remaining_vehicles and random.random() < 0.7:
+                if solution[selected_type] < remaining_vehicles and rng.random() < 0.7:
                     solution[selected_type] += 1
                     remaining_vehicles -= 1
-                elif random.random() < 0.2:
+                elif rng.random() < 0.2:
                     break
             
             if self.is_valid_solution(solution, size_distance):
@@ -114,12 +152,12 @@ class MultiObjectiveFleetOptimizer:
         
         return population
 
-    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple) -> Tuple[Dict, Dict]:
+    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple, rng: np.random.Generator) -> Tuple[Dict, Dict]:
         attempts = 0
         max_attempts = 10
         
         while attempts < max_attempts:
-            crossover_point = random.randint(1, len(parent1) - 1)
+            crossover_point = rng.integers(1, len(parent1))
             child1 = {}
             child2 = {}
             
@@ -140,7 +178,7 @@ class MultiObjectiveFleetOptimizer:
         # If we can't create valid children, return copies of parents
         return parent1.copy(), parent2.copy()
 
-    def mutate(self, solution: Dict, size_distance: Tuple, mutation_rate: float = 0.2) -> Dict:
+    def mutate(self, solution: Dict, size_distance: Tuple, rng: np.random.Generator, mutation_rate: float = 0.2) -> Dict:
         attempts = 0
         max_attempts = 10
         max_vehicles = self.max_vehicles_by_group[size_distance]
@@ -150,8 +188,8 @@ class MultiObjectiveFleetOptimizer:
             total_vehicles = sum(mutated_solution.values())
             
             for vehicle_type in mutated_solution.keys():
-                if random.random() < mutation_rate:
-                    change = random.choice([-1, 1, -mutated_solution[vehicle_type]])
+                if rng.random() < mutation_rate:
+                    change = [-1, 1, -mutated_solution[vehicle_type]][rng.integers(3)]
                     
                     if ((change == 1 and total_vehicles < max_vehicles) or 
                         (change < 0 and mutated_solution[vehicle_type] + change >= 0)):
@@ -169,31 +207,17 @@ class MultiObjectiveFleetOptimizer:
         if not self.is_valid_solution(solution, size_distance):
             return float('-inf')
             
-        vehicles = self.vehicles_by_size_distance[size_distance]
-        vehicle_dict = {v['ID']: v for v in vehicles}
-        demand = vehicles[0]['demand']
+        context = self.group_contexts[size_distance]
+        demand = context.demand
 
-        total_cost = 0
-        total_emissions = 0
-        total_capacity = 0
-        # weighted_topsis = 0
-        
-        for vehicle_type, num_vehicles in solution.items():
-            if num_vehicles > 0:
-                vehicle = vehicle_dict[vehicle_type]
-                total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
-                total_capacity += num_vehicles * vehicle['Yearly range (km)']
-                # weighted_topsis += num_vehicles * vehicle['Rank']
+        total_cost, total_emissions, total_capacity = self.evaluate_solution(solution, size_distance)
         
         demand_penalty = max(0, demand - total_capacity) * 1000
         if demand_penalty > 0:  # Solution doesn't meet demand
             return float('-inf')
         
-        max_possible_cost = max(self.calculate_total_cost(self.max_vehicles_by_group[size_distance], v) 
-                                    for v in vehicles)
-        max_possible_emissions = max(self.calculate_total_emissions(self.max_vehicles_by_group[size_distance], v) 
-                                   for v in vehicles)
+        max_possible_cost = context.max_possible_cost
+        max_possible_emissions = context.max_possible_emissions
         
         normalized_cost = 1 - (total_cost / max_possible_cost if max_possible_cost > 0 else 0)
         normalized_emissions = 1 - (total_emissions / max_possible_emissions if max_possible_emissions > 0 else 0)
@@ -209,6 +233,7 @@ class MultiObjectiveFleetOptimizer:
     def pareto_rank(self, population: List[Dict], size_distance: Tuple) -> List[Tuple[Dict, int]]:
 
         solution_metrics = []
+        demand = self.group_contexts[size_distance].demand
         
         # Calculate metrics for each solution
         for solution in population:
@@ -216,72 +241,40 @@ class MultiObjectiveFleetOptimizer:
                 solution_metrics.append((solution, float('inf'), float('inf')))
                 continue
                 
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            total_capacity = 0
-            
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
-                    total_capacity += num_vehicles * vehicle['Yearly range (km)']
+            total_cost, total_emissions, total_capacity = self.evaluate_solution(solution, size_distance)[:3]
             
-            demand = vehicles[0]['demand']
             if total_capacity < demand:
                 solution_metrics.append((solution, float('inf'), float('inf')))
             else:
                 solution_metrics.append((solution, total_cost, total_emissions))
         
-        ranks = []
-        remaining = solution_metrics.copy()
-        rank = 0
+        fronts = fast_non_dominated_sort([(cost, emissions) for _, cost, emissions in solution_metrics])
+        order = np.argsort(fronts, kind='stable')
         
-        while remaining:
-            pareto_front = []
-            for i, (sol, cost, emissions) in enumerate(remaining):
-                is_dominated = False
-                
-                for _, other_cost, other_emissions in remaining:
-
-                    if (other_cost < cost and other_emissions <= emissions) or \
-                       (other_cost <= cost and other_emissions < emissions):
-                        is_dominated = True
-                        break
-                
-                if not is_dominated:
-                    pareto_front.append((sol, rank))
-                    
-            remaining = [(sol, cost, emissions) for (sol, cost, emissions) in remaining 
-                         if not any(sol is p_sol for p_sol, _ in pareto_front)]
-            
-            ranks.extend(pareto_front)
-            rank += 1
-        return ranks
+        return [(solution_metrics[i][0], int(fronts[i])) for i in order]
 
     def non_dominated_sorting(self, population: List[Dict], size_distance: Tuple):
         ranks = self.pareto_rank(population, size_distance)
         ranks.sort(key=lambda x: x[1], reverse=True)  # Sort by rank (lower is better)
         return ranks
 
-    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50) -> Dict:
-        population = self.generate_initial_population(size_distance, population_size)
+    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50,
+                 rng: np.random.Generator = None) -> Dict:
+        rng = np.random.default_rng() if rng is None else rng
+        population = self.generate_initial_population(size_distance, rng, population_size)
         best_solution = None
         best_fitness = float('-inf')
         
         for gen in range(generations):
             offspring = []
             while len(offspring) < population_size:
-                parent1 = self.tournament_selection(population, size_distance)
-                parent2 = self.tournament_selection(population, size_distance)
+                parent1 = self.tournament_selection(population, size_distance, rng)
+                parent2 = self.tournament_selection(population, size_distance, rng)
                 
-                child1, child2 = self.crossover(parent1, parent2, size_distance)
+                child1, child2 = self.crossover(parent1, parent2, size_distance, rng)
                 
-                child1 = self.mutate(child1, size_distance)
-                child2 = self.mutate(child2, size_distance)
+                child1 = self.mutate(child1, size_distance, rng)
+                child2 = self.mutate(child2, size_distance, rng)
                 
                 offspring.extend([child1, child2])
             
@@ -313,9 +306,10 @@ class MultiObjectiveFleetOptimizer:
                     best_fitness = fitness
         return best_solution
     
-    def tournament_selection(self, population: List[Dict], size_distance: Tuple, tournament_size: int = 3) -> Dict:
+    def tournament_selection(self, population: List[Dict], size_distance: Tuple, rng: np.random.Generator, tournament_size: int = 3) -> Dict:
         """Tournament selection based on fitness"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
+        contenders = rng.choice(len(population), size=min(tournament_size, len(population)), replace=False)
+        tournament = [population[i] for i in contenders]
         return max(tournament, key=lambda x: self.fitness_function(x, size_distance))
 
     def crowding_distance_sort(self, solutions: List[Dict], size_distance: Tuple) -> List[Dict]:
@@ -324,17 +318,7 @@ class MultiObjectiveFleetOptimizer:
 
         metrics = []
         for i, solution in enumerate(solutions):
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
+            total_cost, total_emissions = self.evaluate_solution(solution, size_distance)[:2]
             
             metrics.append((i, solution, total_cost, total_emissions))
         
@@ -372,16 +356,17 @@ class MultiObjectiveFleetOptimizer:
 
     def get_optimized_results(self, year, generations, population_size) -> pd.DataFrame:
         results = []
+        seeds = self.group_seeds(year)
         
         for size_distance in self.vehicles_by_size_distance.keys():
-            best_solution = self.optimize(size_distance, generations, population_size)
+            best_solution = self.optimize(size_distance, generations, population_size, rng=np.random.default_rng(seeds[size_distance]))
             max_vehicles = self.max_vehicles_by_group[size_distance]
             if best_solution is None:
                 continue
             pprint(best_solution)
             for vehicle_type, num_vehicles in best_solution.items():
                 if num_vehicles > 0:
-                    vehicle_data = next(v for v in self.vehicles_by_size_distance[size_distance] if v['ID'] == vehicle_type)
+                    vehicle_data = self.group_contexts[size_distance].vehicle_records[vehicle_type]
                     total_cost = self.calculate_total_cost(num_vehicles, vehicle_data)
                     total_emissions = self.calculate_total_emissions(num_vehicles, vehicle_data)
                     Allocation = vehicle_data.get('Allocation')
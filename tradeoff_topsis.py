@@ -1,22 +1,37 @@
 import pandas as pd
 import numpy as np
 import math
-import random 
 from typing import List, Dict, Tuple
+from population import deduplicate, fill_survivors, add_immigrants, genotype
+from pareto import fast_non_dominated_sort
+from utilities.objective_cache import ObjectiveCache
+from utilities.group_cache import GroupResultCache
+from group_context import GroupContext, group_seed_sequences
 from pprint import pprint
 
 class MultiObjectiveFleetOptimizer:
-    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5):
+    # Part of every group result cache key; bump it whenever a change to the operators changes results
+    ENGINE_VERSION = 1
+
+    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5, seed: int = None):
         self.data = data
+        # Run seed; each group draws from its own stream spawned from it (see group_seeds)
+        self.seed = seed
         self.emission_weight = emission_weight
         self.cost_weight = cost_weight
         self.vehicles_by_size_distance = self._group_vehicles()
         self.max_vehicles_by_group = self._calculate_max_vehicles()
+        self.group_contexts = self._build_group_contexts()
+        self.objective_cache = ObjectiveCache()
         
         total_weight = emission_weight + cost_weight
         self.emission_weight = emission_weight / total_weight
         self.cost_weight = cost_weight / total_weight
     
+    def group_seeds(self, year: int) -> Dict:
+        """One SeedSequence per group for the year, keyed by the group itself (see group_seed_sequences)"""
+        return group_seed_sequences(self.seed, year, self.vehicles_by_size_distance.keys())
+
     def _group_vehicles(self) -> Dict:
         groups = {}
         for _, row in self.data.iterrows():
@@ -60,6 +75,13 @@ class MultiObjectiveFleetOptimizer:
         
         return max_vehicles
 
+    def _build_group_contexts(self) -> Dict:
+        return {
+            key: GroupContext(key, vehicles, self.max_vehicles_by_group[key],
+                              self.calculate_total_cost, self.calculate_total_emissions)
+            for key, vehicles in self.vehicles_by_size_distance.items()
+        }
+
     def is_valid_solution(self, solution: Dict, size_distance: Tuple) -> bool:
         if sum(solution.values()) == 0:
             return False
@@ -82,96 +104,13 @@ class MultiObjectiveFleetOptimizer:
         
         return vehicle['carbon_emissions_per_km'] * distance_per_vehicle * num_vehicles
 
-    def generate_initial_population(self, size_distance: Tuple, population_size: int = 50) -> List[Dict]:
-
-        population = []
-        vehicles = self.vehicles_by_size_distance[size_distance]
-        max_vehicles = self.max_vehicles_by_group[size_distance]
-        
-        topsis_scores = [v['Rank'] for v in vehicles]
-        total_topsis = sum(topsis_scores)
-        normalized_topsis = [score/total_topsis for score in topsis_scores] if total_topsis > 0 else [1/len(topsis_scores)] * len(topsis_scores)
-        # prob = [(1 - x)/10 for x in normalized_topsis]
-        vehicle_types = [v['ID'] for v in vehicles]
-        # pprint(normalized_topsis)
-        while len(population) < population_size:
-
-            solution = {v_type: 0 for v_type in vehicle_types}
-            remaining_vehicles = max_vehicles
-            
-            while remaining_vehicles > 0:
-                selected_idx = np.random.choice(range(len(vehicle_types)), p=normalized_topsis)
-                selected_type = vehicle_types[selected_idx]
-                
-                if solution[selected_type] < remaining_vehicles and random.random() < 0.7:
-                    solution[selected_type] += 1
-                    remaining_vehicles -= 1
-                elif random.random() < 0.2:
-                    break
-            
-            if self.is_valid_solution(solution, size_distance):
-                population.append(solution)
-        
-        return population
-
-    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple) -> Tuple[Dict, Dict]:
-        attempts = 0
-        max_attempts = 10
-        
-        while attempts < max_attempts:
-            crossover_point = random.randint(1, len(parent1) - 1)
-            child1 = {}
-            child2 = {}
-            
-            for i, vehicle_type in enumerate(parent1.keys()):
-                if i < crossover_point:
-                    child1[vehicle_type] = parent1[vehicle_type]
-                    child2[vehicle_type] = parent2[vehicle_type]
-                else:
-                    child1[vehicle_type] = parent2[vehicle_type]
-                    child2[vehicle_type] = parent1[vehicle_type]
-            
-            if (self.is_valid_solution(child1, size_distance) and 
-                self.is_valid_solution(child2, size_distance)):
-                return child1, child2
-            
-            attempts += 1
-        
-        # If we can't create valid children, return copies of parents
-        return parent1.copy(), parent2.copy()
-
-    def mutate(self, solution: Dict, size_distance: Tuple, mutation_rate: float = 0.2) -> Dict:
-        attempts = 0
-        max_attempts = 10
-        max_vehicles = self.max_vehicles_by_group[size_distance]
-        
-        while attempts < max_attempts:
-            mutated_solution = solution.copy()
-            total_vehicles = sum(mutated_solution.values())
-            
-            for vehicle_type in mutated_solution.keys():
-                if random.random() < mutation_rate:
-                    change = random.choice([-1, 1, -mutated_solution[vehicle_type]])
-                    
-                    if ((change == 1 and total_vehicles < max_vehicles) or 
-                        (change < 0 and mutated_solution[vehicle_type] + change >= 0)):
-                        mutated_solution[vehicle_type] += change
-                        total_vehicles += change
-            
-            if self.is_valid_solution(mutated_solution, size_distance):
-                return mutated_solution
-            
-            attempts += 1
-        
-        return solution
+    def evaluate_solution(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float, float]:
+        """Total cost, emissions, capacity and TOPSIS-weighted vehicle count, computed once per genotype"""
+        key = (size_distance, tuple(solution.values()))
+        return self.objective_cache.get_or_compute(key, lambda: self._compute_objectives(solution, size_distance))
 
-    def fitness_function(self, solution: Dict, size_distance: Tuple) -> float:
-        if not self.is_valid_solution(solution, size_distance):
-            return float('-inf')
-            
-        vehicles = self.vehicles_by_size_distance[size_distance]
-        vehicle_dict = {v['ID']: v for v in vehicles}
-        demand = vehicles[0]['demand']
+    def _compute_objectives(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float, float]:
+        vehicle_dict = self.group_contexts[size_distance].vehicle_dict
 
         total_cost = 0
         total_emissions = 0
@@ -186,14 +125,50 @@ class MultiObjectiveFleetOptimizer:
                 total_capacity += num_vehicles * vehicle['Yearly range (km)']
                 weighted_topsis += num_vehicles * vehicle['Rank']
         
+        return total_cost, total_emissions, total_capacity, weighted_topsis
+
+    def generate_initial_population(self, size_distance: Tuple, rng: np.random.Generator, population_size: int = 50) -> List[Dict]:
+        """Samples population_size fleets from the feasible region, drawing vehicle types by TOPSIS score"""
+        context = self.group_contexts[size_distance]
+        return [context.to_solution(context.sample_feasible(rng)) for _ in range(population_size)]
+
+    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple, rng: np.random.Generator) -> Tuple[Dict, Dict]:
+        """One-point crossover; children that leave the feasible region are repaired"""
+        context = self.group_contexts[size_distance]
+        if len(parent1) < 2:
+            return parent1.copy(), parent2.copy()
+        counts1 = context.to_vector(parent1)
+        counts2 = context.to_vector(parent2)
+        crossover_point = rng.integers(1, len(parent1))
+        head = np.arange(len(parent1)) < crossover_point
+        child1 = context.repair(np.where(head, counts1, counts2), rng)
+        child2 = context.repair(np.where(head, counts2, counts1), rng)
+        return context.to_solution(child1), context.to_solution(child2)
+
+    def mutate(self, solution: Dict, size_distance: Tuple, rng: np.random.Generator, mutation_rate: float = 0.2) -> Dict:
+        """Adds or removes one vehicle, or drops a type, per gene with probability mutation_rate, then repairs"""
+        context = self.group_contexts[size_distance]
+        counts = context.to_vector(solution)
+        mask = rng.random(len(counts)) < mutation_rate
+        choice = rng.integers(0, 3, size=len(counts))
+        change = np.select([choice == 0, choice == 1], [-1, 1], default=-counts)
+        return context.to_solution(context.repair(counts + np.where(mask, change, 0), rng))
+
+    def fitness_function(self, solution: Dict, size_distance: Tuple) -> float:
+        if not self.is_valid_solution(solution, size_distance):
+            return float('-inf')
+            
+        context = self.group_contexts[size_distance]
+        demand = context.demand
+
+        total_cost, total_emissions, total_capacity, weighted_topsis = self.evaluate_solution(solution, size_distance)
+        
         demand_penalty = max(0, demand - total_capacity) * 1000
         if demand_penalty > 0:  # Solution doesn't meet demand
             return float('-inf')
         
-        max_possible_cost = max(self.calculate_total_cost(self.max_vehicles_by_group[size_distance], v) 
-                                    for v in vehicles)
-        max_possible_emissions = max(self.calculate_total_emissions(self.max_vehicles_by_group[size_distance], v) 
-                                   for v in vehicles)
+        max_possible_cost = context.max_possible_cost
+        max_possible_emissions = context.max_possible_emissions
         
         normalized_cost = 1 - (total_cost / max_possible_cost if max_possible_cost > 0 else 0)
         normalized_emissions = 1 - (total_emissions / max_possible_emissions if max_possible_emissions > 0 else 0)
@@ -209,6 +184,7 @@ class MultiObjectiveFleetOptimizer:
     def pareto_rank(self, population: List[Dict], size_distance: Tuple) -> List[Tuple[Dict, int]]:
 
         solution_metrics = []
+        demand = self.group_contexts[size_distance].demand
         
         # Calculate metrics for each solution
         for solution in population:
@@ -216,95 +192,58 @@ class MultiObjectiveFleetOptimizer:
                 solution_metrics.append((solution, float('inf'), float('inf')))
                 continue
                 
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            total_capacity = 0
-            
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
-                    total_capacity += num_vehicles * vehicle['Yearly range (km)']
+            total_cost, total_emissions, total_capacity = self.evaluate_solution(solution, size_distance)[:3]
             
-            demand = vehicles[0]['demand']
             if total_capacity < demand:
                 solution_metrics.append((solution, float('inf'), float('inf')))
             else:
                 solution_metrics.append((solution, total_cost, total_emissions))
         
-        ranks = []
-        remaining = solution_metrics.copy()
-        rank = 0
+        fronts = fast_non_dominated_sort([(cost, emissions) for _, cost, emissions in solution_metrics])
+        order = np.argsort(fronts, kind='stable')
         
-        while remaining:
-            pareto_front = []
-            for i, (sol, cost, emissions) in enumerate(remaining):
-                is_dominated = False
-                
-                for _, other_cost, other_emissions in remaining:
-
-                    if (other_cost < cost and other_emissions <= emissions) or \
-                       (other_cost <= cost and other_emissions < emissions):
-                        is_dominated = True
-                        break
-                
-                if not is_dominated:
-                    pareto_front.append((sol, rank))
-                    
-            remaining = [(sol, cost, emissions) for (sol, cost, emissions) in remaining 
-                         if not any(sol is p_sol for p_sol, _ in pareto_front)]
-            
-            ranks.extend(pareto_front)
-            rank += 1
-        return ranks
+        return [(solution_metrics[i][0], int(fronts[i])) for i in order]
 
     def non_dominated_sorting(self, population: List[Dict], size_distance: Tuple):
         ranks = self.pareto_rank(population, size_distance)
         ranks.sort(key=lambda x: x[1], reverse=True)  # Sort by rank (lower is better)
         return ranks
 
-    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50) -> Dict:
-        population = self.generate_initial_population(size_distance, population_size)
+    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50,
+                 rng: np.random.Generator = None) -> Dict:
+        rng = np.random.default_rng() if rng is None else rng
+        # The population holds each genotype once; multiplicity counts its copies for selection
+        population, multiplicity = deduplicate(self.generate_initial_population(size_distance, rng, population_size))
         best_solution = None
         best_fitness = float('-inf')
         
         for gen in range(generations):
             offspring = []
             while len(offspring) < population_size:
-                parent1 = self.tournament_selection(population, size_distance)
-                parent2 = self.tournament_selection(population, size_distance)
+                parent1 = self.tournament_selection(population, size_distance, rng, weights=multiplicity)
+                parent2 = self.tournament_selection(population, size_distance, rng, weights=multiplicity)
                 
-                child1, child2 = self.crossover(parent1, parent2, size_distance)
+                child1, child2 = self.crossover(parent1, parent2, size_distance, rng)
                 
-                child1 = self.mutate(child1, size_distance)
-                child2 = self.mutate(child2, size_distance)
+                child1 = self.mutate(child1, size_distance, rng)
+                child2 = self.mutate(child2, size_distance, rng)
                 
                 offspring.extend([child1, child2])
             
-            combined = population + offspring[:population_size]
+            # Ranking and crowding see every genotype once, however many copies it has
+            offspring = offspring[:population_size]
+            combined, combined_copies = deduplicate(population + offspring, multiplicity + [1] * len(offspring))
             
             ranked_solutions = self.non_dominated_sorting(combined, size_distance)
             
-            new_population = []
-            current_rank = 0
+            # Survivors keep their copies, so a genotype takes as many slots as it has copies
+            new_population, new_multiplicity = fill_survivors(
+                ranked_solutions, dict(zip(map(genotype, combined), combined_copies)), population_size,
+                lambda front: self.crowding_distance_sort(front, size_distance)
+            )
             
-            while len(new_population) < population_size and current_rank <= max(r for _, r in ranked_solutions):
-                current_front = [sol for sol, rank in ranked_solutions if rank == current_rank]
-                
-                if len(new_population) + len(current_front) <= population_size:
-                    new_population.extend(current_front)
-                else:
-                    sorted_front = self.crowding_distance_sort(current_front, size_distance)
-                    remaining_slots = population_size - len(new_population)
-                    new_population.extend(sorted_front[:remaining_slots])
-                
-                current_rank += 1
-            
-            population = new_population
+            population, multiplicity = add_immigrants(new_population, new_multiplicity, population_size,
+                                                      lambda n: self.generate_initial_population(size_distance, rng, n))
             
             for solution in population:
                 fitness = self.fitness_function(solution, size_distance)
@@ -313,9 +252,12 @@ class MultiObjectiveFleetOptimizer:
                     best_fitness = fitness
         return best_solution
     
-    def tournament_selection(self, population: List[Dict], size_distance: Tuple, tournament_size: int = 3) -> Dict:
-        """Tournament selection based on fitness"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
+    def tournament_selection(self, population: List[Dict], size_distance: Tuple, rng: np.random.Generator,
+                             tournament_size: int = 3, weights: List[int] = None) -> Dict:
+        """Tournament selection based on fitness, drawing genotypes in proportion to weights (their multiplicity)"""
+        p = None if weights is None else np.asarray(weights, dtype=float) / sum(weights)
+        contenders = rng.choice(len(population), size=min(tournament_size, len(population)), replace=False, p=p)
+        tournament = [population[i] for i in contenders]
         return max(tournament, key=lambda x: self.fitness_function(x, size_distance))
 
     def crowding_distance_sort(self, solutions: List[Dict], size_distance: Tuple) -> List[Dict]:
@@ -324,17 +266,7 @@ class MultiObjectiveFleetOptimizer:
 
         metrics = []
         for i, solution in enumerate(solutions):
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
+            total_cost, total_emissions = self.evaluate_solution(solution, size_distance)[:2]
             
             metrics.append((i, solution, total_cost, total_emissions))
         
@@ -370,24 +302,40 @@ class MultiObjectiveFleetOptimizer:
         
         return [pair[0] for pair in sorted_pairs]
 
-    def get_optimized_results(self, year, generations, population_size) -> pd.DataFrame:
+    def get_optimized_results(self, year, generations, population_size, result_cache: GroupResultCache = None) -> pd.DataFrame:
         results = []
+        seeds = self.group_seeds(year)
         
         for size_distance in self.vehicles_by_size_distance.keys():
-            best_solution = self.optimize(size_distance, generations, population_size)
             max_vehicles = self.max_vehicles_by_group[size_distance]
+            seed_key = None if self.seed is None else (self.seed, seeds[size_distance].spawn_key)
+            # Groups whose inputs, including carried-over fleet rows, are unchanged reuse the stored result
+            if result_cache is not None:
+                key = GroupResultCache.fingerprint(
+                    type(self).__qualname__, type(self).__module__, self.ENGINE_VERSION, size_distance, self.emission_weight, self.cost_weight,
+                    generations, population_size, max_vehicles, self.vehicles_by_size_distance[size_distance], seed_key
+                )
+                cached_rows = result_cache.get(key)
+                if cached_rows is not None:
+                    results.extend(cached_rows)
+                    continue
+
+            group_rows = []
+            best_solution = self.optimize(size_distance, generations, population_size, rng=np.random.default_rng(seeds[size_distance]))
             if best_solution is None:
+                if result_cache is not None:
+                    result_cache.put(key, group_rows)
                 continue
             pprint(best_solution)
             for vehicle_type, num_vehicles in best_solution.items():
                 if num_vehicles > 0:
-                    vehicle_data = next(v for v in self.vehicles_by_size_distance[size_distance] if v['ID'] == vehicle_type)
+                    vehicle_data = self.group_contexts[size_distance].vehicle_records[vehicle_type]
                     total_cost = self.calculate_total_cost(num_vehicles, vehicle_data)
                     total_emissions = self.calculate_total_emissions(num_vehicles, vehicle_data)
                     Allocation = vehicle_data.get('Allocation')
                     Size = vehicle_data.get('Size')
                     Distance_demand = vehicle_data.get('Distance_demand')
-                    results.append({
+                    group_rows.append({
                         "Allocation": Allocation,
                         "Operating Year": vehicle_data["Operating Year"],
                         "size":Size,
@@ -412,7 +360,9 @@ class MultiObjectiveFleetOptimizer:
                         "No_of_vehicles": num_vehicles,
                         "Max Vehicles": max_vehicles,               
                     })
-                    
+            results.extend(group_rows)
+            if result_cache is not None:
+                result_cache.put(key, group_rows)
         
         # f_df = pd.DataFrame({
         #     "Population": list(range(1, len(fitness_scores) + 1)),
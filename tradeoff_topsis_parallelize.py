@@ -1,23 +1,130 @@
 import pandas as pd
 import numpy as np
 import math
-import random 
+import time
 from typing import List, Dict, Tuple
+from population import deduplicate, fill_survivors, add_immigrants, genotype
+from pareto import fast_non_dominated_sort, hypervolume_2d, SCALED_REFERENCE
+from convergence import ConvergenceMonitor
+from utilities.objective_cache import ObjectiveCache
+from utilities.group_cache import GroupResultCache
+from group_context import GroupContext, group_seed_sequences
 import multiprocessing as mp
 from pprint import pprint
 
 class MultiObjectiveFleetOptimizer:
-    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5):
+    # Part of every group result cache key; bump it whenever a change to the operators changes results
+    ENGINE_VERSION = 1
+
+    def __init__(self, data: pd.DataFrame, emission_weight: float = 0.5, cost_weight: float = 0.5, seed: int = None,
+                 convergence: Dict = None, trace_generations: bool = False, groups: Dict = None):
         self.data = data
+        # Run seed; each group draws from its own stream spawned from it (see group_seeds)
+        self.seed = seed
+        # ConvergenceMonitor settings for early stopping, None runs every generation
+        self.convergence = convergence
+        self.convergence_reports = {}
+        # When set, optimize records one row of progress metrics per generation in generation_trace
+        self.trace_generations = trace_generations
+        self.generation_trace = []
         self.emission_weight = emission_weight
         self.cost_weight = cost_weight
-        self.vehicles_by_size_distance = self._group_vehicles()
+        # Vehicle records already grouped by (size, distance) can be passed instead of data
+        self.vehicles_by_size_distance = self._group_vehicles() if groups is None else groups
         self.max_vehicles_by_group = self._calculate_max_vehicles()
+        self.group_contexts = self._build_group_contexts()
+        self.objective_cache = ObjectiveCache()
+        self.group_timings = []
         
         total_weight = emission_weight + cost_weight
         self.emission_weight = emission_weight / total_weight
         self.cost_weight = cost_weight / total_weight
+
+    @classmethod
+    def from_group(cls, size_distance: Tuple, vehicles: List[Dict], emission_weight: float, cost_weight: float,
+                   convergence: Dict = None, trace_generations: bool = False):
+        """Builds an optimizer for a single group from its vehicle records, without a data frame"""
+        # Workers are handed their group's SeedSequence directly, so no run seed is needed
+        return cls(None, emission_weight, cost_weight, convergence=convergence,
+                   trace_generations=trace_generations, groups={size_distance: vehicles})
+
+    def estimate_group_cost(self, size_distance: Tuple, generations: int, population_size: int) -> int:
+        """Relative GA work for one group, used to schedule the heaviest groups first"""
+        return (len(self.vehicles_by_size_distance[size_distance])
+                * max(self.max_vehicles_by_group[size_distance], 1)
+                * (generations or 1) * (population_size or 1))
+
+    def _group_timing(self, size_distance: Tuple, generations: int, population_size: int, seconds: float) -> Dict:
+        size, distance = size_distance
+        report = self.convergence_reports.get(size_distance, {})
+        return {
+            "size": size,
+            "Distance_demand": distance,
+            "Vehicle_Types": len(self.vehicles_by_size_distance[size_distance]),
+            "Max Vehicles": self.max_vehicles_by_group[size_distance],
+            "Generations": generations,
+            "Population_Size": population_size,
+            "Estimated_Cost": self.estimate_group_cost(size_distance, generations, population_size),
+            "Generations_Used": report.get("Generations_Used", generations),
+            "Stop_Reason": report.get("Stop_Reason", "generations"),
+            "Seconds": seconds,
+        }
+
+    def group_fingerprint(self, size_distance: Tuple, generations: int, population_size: int,
+                          seed_sequence: np.random.SeedSequence = None) -> str:
+        """Key of everything one group's result depends on, including its carried-over fleet rows and seed"""
+        seed_key = None if seed_sequence is None or self.seed is None else (self.seed, seed_sequence.spawn_key)
+        return GroupResultCache.fingerprint(
+            type(self).__qualname__, type(self).__module__, self.ENGINE_VERSION,
+            size_distance,
+            self.emission_weight,
+            self.cost_weight,
+            generations,
+            population_size,
+            self.max_vehicles_by_group[size_distance],
+            self.vehicles_by_size_distance[size_distance],
+            seed_key,
+            self.convergence,
+        )
+
+    def _cached_group_results(self, result_cache: GroupResultCache, generations: int, population_size: int,
+                              seeds: Dict = None) -> Tuple[Dict, Dict]:
+        """
+        Returns:
+            Tuple[Dict, Dict]: fingerprint per group, and stored rows for the groups found in the cache.
+        """
+        if result_cache is None:
+            return {}, {}
+        seeds = seeds or {}
+        fingerprints = {size_distance: self.group_fingerprint(size_distance, generations, population_size, seeds.get(size_distance))
+                        for size_distance in self.vehicles_by_size_distance.keys()}
+        cached = {}
+        for size_distance, key in fingerprints.items():
+            rows = result_cache.get(key)
+            if rows is not None:
+                cached[size_distance] = rows
+        return fingerprints, cached
+
+    def _group_task(self, size_distance: Tuple, generations: int, population_size: int,
+                    seed_sequence: np.random.SeedSequence = None) -> Tuple:
+        """Picklable payload carrying only one group's data and seed to a worker"""
+        return (
+            type(self),
+            size_distance,
+            self.vehicles_by_size_distance[size_distance],
+            self.emission_weight,
+            self.cost_weight,
+            generations,
+            population_size,
+            seed_sequence,
+            self.convergence,
+            self.trace_generations,
+        )
     
+    def group_seeds(self, year: int) -> Dict:
+        """One SeedSequence per group for the year, keyed by the group itself (see group_seed_sequences)"""
+        return group_seed_sequences(self.seed, year, self.vehicles_by_size_distance.keys())
+
     def _group_vehicles(self) -> Dict:
         groups = {}
         for _, row in self.data.iterrows():
@@ -61,6 +168,13 @@ class MultiObjectiveFleetOptimizer:
         
         return max_vehicles
 
+    def _build_group_contexts(self) -> Dict:
+        return {
+            key: GroupContext(key, vehicles, self.max_vehicles_by_group[key],
+                              self.calculate_total_cost, self.calculate_total_emissions)
+            for key, vehicles in self.vehicles_by_size_distance.items()
+        }
+
     def is_valid_solution(self, solution: Dict, size_distance: Tuple) -> bool:
         if sum(solution.values()) == 0:
             return False
@@ -83,96 +197,13 @@ class MultiObjectiveFleetOptimizer:
         
         return vehicle['carbon_emissions_per_km'] * distance_per_vehicle * num_vehicles
 
-    def generate_initial_population(self, size_distance: Tuple, population_size: int = 50) -> List[Dict]:
+    def evaluate_solution(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float, float]:
+        """Total cost, emissions, capacity and TOPSIS-weighted vehicle count, computed once per genotype"""
+        key = (size_distance, tuple(solution.values()))
+        return self.objective_cache.get_or_compute(key, lambda: self._compute_objectives(solution, size_distance))
 
-        population = []
-        vehicles = self.vehicles_by_size_distance[size_distance]
-        max_vehicles = self.max_vehicles_by_group[size_distance]
-        
-        topsis_scores = [v['Rank'] for v in vehicles]
-        total_topsis = sum(topsis_scores)
-        normalized_topsis = [score/total_topsis for score in topsis_scores] if total_topsis > 0 else [1/len(topsis_scores)] * len(topsis_scores)
-        # prob = [(1 - x)/10 for x in normalized_topsis]
-        vehicle_types = [v['ID'] for v in vehicles]
-        # pprint(normalized_topsis)
-        while len(population) < population_size:
-
-            solution = {v_type: 0 for v_type in vehicle_types}
-            remaining_vehicles = max_vehicles
-            
-            while remaining_vehicles > 0:
-                selected_idx = np.random.choice(range(len(vehicle_types)), p=normalized_topsis)
-                selected_type = vehicle_types[selected_idx]
-                
-                if solution[selected_type] < remaining_vehicles and random.random() < 0.7:
-                    solution[selected_type] += 1
-                    remaining_vehicles -= 1
-                elif random.random() < 0.2:
-                    break
-            
-            if self.is_valid_solution(solution, size_distance):
-                population.append(solution)
-        
-        return population
-
-    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple) -> Tuple[Dict, Dict]:
-        attempts = 0
-        max_attempts = 10
-        
-        while attempts < max_attempts:
-            crossover_point = random.randint(1, len(parent1) - 1)
-            child1 = {}
-            child2 = {}
-            
-            for i, vehicle_type in enumerate(parent1.keys()):
-                if i < crossover_point:
-                    child1[vehicle_type] = parent1[vehicle_type]
-                    child2[vehicle_type] = parent2[vehicle_type]
-                else:
-                    child1[vehicle_type] = parent2[vehicle_type]
-                    child2[vehicle_type] = parent1[vehicle_type]
-            
-            if (self.is_valid_solution(child1, size_distance) and 
-                self.is_valid_solution(child2, size_distance)):
-                return child1, child2
-            
-            attempts += 1
-        
-        # If we can't create valid children, return copies of parents
-        return parent1.copy(), parent2.copy()
-
-    def mutate(self, solution: Dict, size_distance: Tuple, mutation_rate: float = 0.2) -> Dict:
-        attempts = 0
-        max_attempts = 10
-        max_vehicles = self.max_vehicles_by_group[size_distance]
-        
-        while attempts < max_attempts:
-            mutated_solution = solution.copy()
-            total_vehicles = sum(mutated_solution.values())
-            
-            for vehicle_type in mutated_solution.keys():
-                if random.random() < mutation_rate:
-                    change = random.choice([-1, 1, -mutated_solution[vehicle_type]])
-                    
-                    if ((change == 1 and total_vehicles < max_vehicles) or 
-                        (change < 0 and mutated_solution[vehicle_type] + change >= 0)):
-                        mutated_solution[vehicle_type] += change
-                        total_vehicles += change
-            
-            if self.is_valid_solution(mutated_solution, size_distance):
-                return mutated_solution
-            
-            attempts += 1
-        
-        return solution
-
-    def fitness_function(self, solution: Dict, size_distance: Tuple) -> float:
-        if not self.is_valid_solution(solution, size_distance):
-            return float('-inf')
-            
-        vehicles = self.vehicles_by_size_distance[size_distance]
-        vehicle_dict = {v['ID']: v for v in vehicles}
-        demand = vehicles[0]['demand']
+    def _compute_objectives(self, solution: Dict, size_distance: Tuple) -> Tuple[float, float, float, float]:
+        vehicle_dict = self.group_contexts[size_distance].vehicle_dict
 
         total_cost = 0
         total_emissions = 0
@@ -187,14 +218,50 @@ class MultiObjectiveFleetOptimizer:
                 total_capacity += num_vehicles * vehicle['Yearly range (km)']
                 weighted_topsis += num_vehicles * vehicle['Rank']
         
+        return total_cost, total_emissions, total_capacity, weighted_topsis
+
+    def generate_initial_population(self, size_distance: Tuple, rng: np.random.Generator, population_size: int = 50) -> List[Dict]:
+        """Samples population_size fleets from the feasible region, drawing vehicle types by TOPSIS score"""
+        context = self.group_contexts[size_distance]
+        return [context.to_solution(context.sample_feasible(rng)) for _ in range(population_size)]
+
+    def crossover(self, parent1: Dict, parent2: Dict, size_distance: Tuple, rng: np.random.Generator) -> Tuple[Dict, Dict]:
+        """One-point crossover; children that leave the feasible region are repaired"""
+        context = self.group_contexts[size_distance]
+        if len(parent1) < 2:
+            return parent1.copy(), parent2.copy()
+        counts1 = context.to_vector(parent1)
+        counts2 = context.to_vector(parent2)
+        crossover_point = rng.integers(1, len(parent1))
+        head = np.arange(len(parent1)) < crossover_point
+        child1 = context.repair(np.where(head, counts1, counts2), rng)
+        child2 = context.repair(np.where(head, counts2, counts1), rng)
+        return context.to_solution(child1), context.to_solution(child2)
+
+    def mutate(self, solution: Dict, size_distance: Tuple, rng: np.random.Generator, mutation_rate: float = 0.2) -> Dict:
+        """Adds or removes one vehicle, or drops a type, per gene with probability mutation_rate, then repairs"""
+        context = self.group_contexts[size_distance]
+        counts = context.to_vector(solution)
+        mask = rng.random(len(counts)) < mutation_rate
+        choice = rng.integers(0, 3, size=len(counts))
+        change = np.select([choice == 0, choice == 1], [-1, 1], default=-counts)
+        return context.to_solution(context.repair(counts + np.where(mask, change, 0), rng))
+
+    def fitness_function(self, solution: Dict, size_distance: Tuple) -> float:
+        if not self.is_valid_solution(solution, size_distance):
+            return float('-inf')
+            
+        context = self.group_contexts[size_distance]
+        demand = context.demand
+
+        total_cost, total_emissions, total_capacity, weighted_topsis = self.evaluate_solution(solution, size_distance)
+        
         demand_penalty = max(0, demand - total_capacity) * 1000
         if demand_penalty > 0:  # Solution doesn't meet demand
             return float('-inf')
         
-        max_possible_cost = max(self.calculate_total_cost(self.max_vehicles_by_group[size_distance], v) 
-                                    for v in vehicles)
-        max_possible_emissions = max(self.calculate_total_emissions(self.max_vehicles_by_group[size_distance], v) 
-                                   for v in vehicles)
+        max_possible_cost = context.max_possible_cost
+        max_possible_emissions = context.max_possible_emissions
         
         normalized_cost = 1 - (total_cost / max_possible_cost if max_possible_cost > 0 else 0)
         normalized_emissions = 1 - (total_emissions / max_possible_emissions if max_possible_emissions > 0 else 0)
@@ -210,6 +277,7 @@ class MultiObjectiveFleetOptimizer:
     def pareto_rank(self, population: List[Dict], size_distance: Tuple) -> List[Tuple[Dict, int]]:
 
         solution_metrics = []
+        demand = self.group_contexts[size_distance].demand
         
         # Calculate metrics for each solution
         for solution in population:
@@ -217,106 +285,136 @@ class MultiObjectiveFleetOptimizer:
                 solution_metrics.append((solution, float('inf'), float('inf')))
                 continue
                 
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            total_capacity = 0
+            total_cost, total_emissions, total_capacity = self.evaluate_solution(solution, size_distance)[:3]
             
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
-                    total_capacity += num_vehicles * vehicle['Yearly range (km)']
-            
-            demand = vehicles[0]['demand']
             if total_capacity < demand:
                 solution_metrics.append((solution, float('inf'), float('inf')))
             else:
                 solution_metrics.append((solution, total_cost, total_emissions))
         
-        ranks = []
-        remaining = solution_metrics.copy()
-        rank = 0
+        fronts = fast_non_dominated_sort([(cost, emissions) for _, cost, emissions in solution_metrics])
+        order = np.argsort(fronts, kind='stable')
         
-        while remaining:
-            pareto_front = []
-            for i, (sol, cost, emissions) in enumerate(remaining):
-                is_dominated = False
-                
-                for _, other_cost, other_emissions in remaining:
-
-                    if (other_cost < cost and other_emissions <= emissions) or \
-                       (other_cost <= cost and other_emissions < emissions):
-                        is_dominated = True
-                        break
-                
-                if not is_dominated:
-                    pareto_front.append((sol, rank))
-                    
-            remaining = [(sol, cost, emissions) for (sol, cost, emissions) in remaining 
-                         if not any(sol is p_sol for p_sol, _ in pareto_front)]
-            
-            ranks.extend(pareto_front)
-            rank += 1
-        return ranks
+        return [(solution_metrics[i][0], int(fronts[i])) for i in order]
 
     def non_dominated_sorting(self, population: List[Dict], size_distance: Tuple):
         ranks = self.pareto_rank(population, size_distance)
         ranks.sort(key=lambda x: x[1], reverse=True)  # Sort by rank (lower is better)
         return ranks
 
-    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50) -> Dict:
-        population = self.generate_initial_population(size_distance, population_size)
+    def front_hypervolume(self, population: List[Dict], size_distance: Tuple) -> float:
+        """
+        Hypervolume of the feasible rank-0 solutions, with cost and emissions scaled
+        by the group's objective bounds, measured from SCALED_REFERENCE.
+        """
+        context = self.group_contexts[size_distance]
+        max_cost, max_emissions = context.objective_bounds
+        points = []
+        for solution in population:
+            if not self.is_valid_solution(solution, size_distance):
+                continue
+            total_cost, total_emissions, total_capacity = self.evaluate_solution(solution, size_distance)[:3]
+            if total_capacity >= context.demand:
+                points.append((total_cost / max_cost, total_emissions / max_emissions))
+        return hypervolume_2d(points, SCALED_REFERENCE)
+
+    def _trace_generation(self, size_distance: Tuple, generation: int, population: List[Dict],
+                          front_size: int, evaluations: int, phase_seconds: Dict):
+        """Appends one generation's progress metrics to generation_trace"""
+        size, distance = size_distance
+        self.generation_trace.append({
+            "size": size,
+            "Distance_demand": distance,
+            "Generation": generation,
+            "Hypervolume": self.front_hypervolume(population, size_distance),
+            "Front_Size": front_size,
+            "Distinct_Genotypes": len(population),
+            "Evaluations": evaluations,
+            "Selection_Seconds": phase_seconds["selection"],
+            "Variation_Seconds": phase_seconds["variation"],
+            "Ranking_Seconds": phase_seconds["ranking"],
+            "Crowding_Seconds": phase_seconds["crowding"],
+        })
+
+    def _convergence_monitor(self, size_distance: Tuple, generations: int) -> ConvergenceMonitor:
+        # Without settings no rule is set, so the monitor only counts generations
+        monitor = ConvergenceMonitor(**(self.convergence or {}))
+        self.convergence_reports[size_distance] = {"Generations_Used": generations, "Stop_Reason": "generations"}
+        return monitor
+
+    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50,
+                 rng: np.random.Generator = None) -> Dict:
+        rng = np.random.default_rng() if rng is None else rng
+        # The population holds each genotype once; multiplicity counts its copies for selection
+        population, multiplicity = deduplicate(self.generate_initial_population(size_distance, rng, population_size))
         best_solution = None
         best_fitness = float('-inf')
+        monitor = self._convergence_monitor(size_distance, generations)
         
         for gen in range(generations):
+            phase_seconds = {"selection": 0.0, "variation": 0.0, "ranking": 0.0, "crowding": 0.0}
+            evaluations_before = self.objective_cache.misses
             offspring = []
             while len(offspring) < population_size:
-                parent1 = self.tournament_selection(population, size_distance)
-                parent2 = self.tournament_selection(population, size_distance)
+                started = time.perf_counter()
+                parent1 = self.tournament_selection(population, size_distance, rng, weights=multiplicity)
+                parent2 = self.tournament_selection(population, size_distance, rng, weights=multiplicity)
+                selected = time.perf_counter()
                 
-                child1, child2 = self.crossover(parent1, parent2, size_distance)
+                child1, child2 = self.crossover(parent1, parent2, size_distance, rng)
                 
-                child1 = self.mutate(child1, size_distance)
-                child2 = self.mutate(child2, size_distance)
+                child1 = self.mutate(child1, size_distance, rng)
+                child2 = self.mutate(child2, size_distance, rng)
+                phase_seconds["selection"] += selected - started
+                phase_seconds["variation"] += time.perf_counter() - selected
                 
                 offspring.extend([child1, child2])
             
-            combined = population + offspring[:population_size]
+            # Ranking and crowding see every genotype once, however many copies it has
+            offspring = offspring[:population_size]
+            combined, combined_copies = deduplicate(population + offspring, multiplicity + [1] * len(offspring))
             
+            started = time.perf_counter()
             ranked_solutions = self.non_dominated_sorting(combined, size_distance)
+            phase_seconds["ranking"] += time.perf_counter() - started
             
-            new_population = []
-            current_rank = 0
+            # Survivors keep their copies, so a genotype takes as many slots as it has copies
+            started = time.perf_counter()
+            new_population, new_multiplicity = fill_survivors(
+                ranked_solutions, dict(zip(map(genotype, combined), combined_copies)), population_size,
+                lambda front: self.crowding_distance_sort(front, size_distance)
+            )
+            phase_seconds["crowding"] += time.perf_counter() - started
             
-            while len(new_population) < population_size and current_rank <= max(r for _, r in ranked_solutions):
-                current_front = [sol for sol, rank in ranked_solutions if rank == current_rank]
-                
-                if len(new_population) + len(current_front) <= population_size:
-                    new_population.extend(current_front)
-                else:
-                    sorted_front = self.crowding_distance_sort(current_front, size_distance)
-                    remaining_slots = population_size - len(new_population)
-                    new_population.extend(sorted_front[:remaining_slots])
-                
-                current_rank += 1
-            
-            population = new_population
+            # Diversity is measured on the survivors, before immigrants top it up
+            diversity = len(new_population) / population_size
+            population, multiplicity = add_immigrants(new_population, new_multiplicity, population_size,
+                                                      lambda n: self.generate_initial_population(size_distance, rng, n))
             
             for solution in population:
                 fitness = self.fitness_function(solution, size_distance)
                 if fitness > best_fitness:
                     best_solution = solution
                     best_fitness = fitness
+
+            if self.trace_generations:
+                front_size = min(sum(1 for _, rank in ranked_solutions if rank == 0), population_size)
+                self._trace_generation(size_distance, gen, population, front_size,
+                                       self.objective_cache.misses - evaluations_before, phase_seconds)
+
+            hypervolume = self.front_hypervolume(population, size_distance) if monitor.tracks_hypervolume else None
+            stop = monitor.update(best_fitness, hypervolume, diversity)
+            self.convergence_reports[size_distance] = monitor.report()
+            if stop:
+                break
         return best_solution
     
-    def tournament_selection(self, population: List[Dict], size_distance: Tuple, tournament_size: int = 3) -> Dict:
-        """Tournament selection based on fitness"""
-        tournament = random.sample(population, min(tournament_size, len(population)))
+    def tournament_selection(self, population: List[Dict], size_distance: Tuple, rng: np.random.Generator,
+                             tournament_size: int = 3, weights: List[int] = None) -> Dict:
+        """Tournament selection based on fitness, drawing genotypes in proportion to weights (their multiplicity)"""
+        p = None if weights is None else np.asarray(weights, dtype=float) / sum(weights)
+        contenders = rng.choice(len(population), size=min(tournament_size, len(population)), replace=False, p=p)
+        tournament = [population[i] for i in contenders]
         return max(tournament, key=lambda x: self.fitness_function(x, size_distance))
 
     def crowding_distance_sort(self, solutions: List[Dict], size_distance: Tuple) -> List[Dict]:
@@ -325,17 +423,7 @@ class MultiObjectiveFleetOptimizer:
 
         metrics = []
         for i, solution in enumerate(solutions):
-            vehicles = self.vehicles_by_size_distance[size_distance]
-            vehicle_dict = {v['ID']: v for v in vehicles}
-            
-            total_cost = 0
-            total_emissions = 0
-            
-            for vehicle_type, num_vehicles in solution.items():
-                if num_vehicles > 0:
-                    vehicle = vehicle_dict[vehicle_type]
-                    total_cost += self.calculate_total_cost(num_vehicles, vehicle)
-                    total_emissions += self.calculate_total_emissions(num_vehicles, vehicle)
+            total_cost, total_emissions = self.evaluate_solution(solution, size_distance)[:2]
             
             metrics.append((i, solution, total_cost, total_emissions))
         
@@ -372,19 +460,26 @@ class MultiObjectiveFleetOptimizer:
         return [pair[0] for pair in sorted_pairs]
     
         # New method: Process a single size_distance group
-    def _process_size_distance(self, size_distance: Tuple, generations, population_size) -> List[Dict]:
-        results = []
-        best_solution = self.optimize(size_distance, generations, population_size)
-        max_vehicles = self.max_vehicles_by_group[size_distance]
+    def _process_size_distance(self, size_distance: Tuple, generations, population_size,
+                               rng: np.random.Generator = None) -> List[Dict]:
+        best_solution = self.optimize(size_distance, generations, population_size, rng=rng)
         
         if best_solution is None:
-            return results
+            return []
             
-        print(f"Processed {size_distance}: {best_solution}")
+        report = self.convergence_reports.get(size_distance, {})
+        print(f"Processed {size_distance}: {best_solution} (objective cache: {self.objective_cache.stats()}, "
+              f"generations: {report.get('Generations_Used', generations)}, stop: {report.get('Stop_Reason', 'generations')})")
+        
+        return self._solution_rows(size_distance, best_solution)
+
+    def _solution_rows(self, size_distance: Tuple, best_solution: Dict) -> List[Dict]:
+        results = []
+        max_vehicles = self.max_vehicles_by_group[size_distance]
         
         for vehicle_type, num_vehicles in best_solution.items():
             if num_vehicles > 0:
-                vehicle_data = next(v for v in self.vehicles_by_size_distance[size_distance] if v['ID'] == vehicle_type)
+                vehicle_data = self.group_contexts[size_distance].vehicle_records[vehicle_type]
                 total_cost = self.calculate_total_cost(num_vehicles, vehicle_data)
                 total_emissions = self.calculate_total_emissions(num_vehicles, vehicle_data)
                 Allocation = vehicle_data.get('Allocation')
@@ -418,17 +513,110 @@ class MultiObjectiveFleetOptimizer:
         
         return results
 
-    def get_optimized_results(self, year, generations: int = 100, population_size: int = 50) -> pd.DataFrame:
-        all_results = []
-        
-        # Prepare input as tuples (size_distance, generations, population_size)
-        input_args = [(size_distance, generations, population_size) for size_distance in self.vehicles_by_size_distance.keys()]
-        
-        with mp.Pool(processes=mp.cpu_count()) as pool:
-            all_results = pool.starmap(self._process_size_distance, input_args)
+    def get_optimized_results(self, year, generations: int = 100, population_size: int = 50, pool=None,
+                              result_cache: GroupResultCache = None) -> pd.DataFrame:
+        # Groups whose inputs are unchanged since a stored run are not optimised again. A traced
+        # run skips the cache, since cached groups would be missing from the generation trace
+        if self.trace_generations:
+            result_cache = None
+        seeds = self.group_seeds(year)
+        fingerprints, all_results = self._cached_group_results(result_cache, generations, population_size, seeds)
+        pending = [size_distance for size_distance in self.vehicles_by_size_distance.keys() if size_distance not in all_results]
+
+        seconds = []
+        if pending:
+            # Reuse the caller's pool when given one, otherwise fall back to a pool for this year only
+            if pool is None:
+                with OptimizerPool() as year_pool:
+                    results, seconds = year_pool.map_groups(self, generations, population_size, pending, seeds)
+            else:
+                results, seconds = pool.map_groups(self, generations, population_size, pending, seeds)
+            for size_distance, rows in zip(pending, results):
+                all_results[size_distance] = rows
+                if result_cache is not None:
+                    result_cache.put(fingerprints[size_distance], rows)
+
+        self.group_timings = [
+            {"Operating Year": year, **self._group_timing(size_distance, generations, population_size, elapsed)}
+            for size_distance, elapsed in zip(pending, seconds)
+        ]
+        self.generation_trace = [{"Operating Year": year, **row} for row in self.generation_trace]
 
         # Flatten the list of lists
-        flattened_results = [item for sublist in all_results for item in sublist]
+        flattened_results = [item for size_distance in self.vehicles_by_size_distance.keys() for item in all_results[size_distance]]
 
         df = pd.DataFrame(flattened_results)
         return df
+
+
+def _optimize_group(indexed_task: Tuple) -> Tuple[int, List[Dict], float, Dict, List[Dict]]:
+    """Worker entry point: rebuilds a single-group optimizer from its payload and optimizes it"""
+    index, task = indexed_task
+    start = time.perf_counter()
+    (optimizer_class, size_distance, vehicles, emission_weight, cost_weight,
+     generations, population_size, seed_sequence, convergence, trace_generations) = task
+    optimizer = optimizer_class.from_group(size_distance, vehicles, emission_weight, cost_weight,
+                                           convergence, trace_generations)
+    rng = np.random.default_rng(seed_sequence)
+    rows = optimizer._process_size_distance(size_distance, generations, population_size, rng)
+    return (index, rows, time.perf_counter() - start,
+            optimizer.convergence_reports.get(size_distance, {}), optimizer.generation_trace)
+
+class OptimizerPool:
+    def __init__(self, processes: int = None):
+        """
+        Long-lived worker pool for size-distance group optimisation.
+        Create it once per pipeline run (or once per process) and pass it to
+        get_optimized_results; workers are started on first use and reused
+        for every year. Each task carries only its own group's vehicle records.
+        Args:
+            processes (int): number of worker processes, defaults to the CPU count.
+        """
+        self.processes = processes or mp.cpu_count()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def start(self):
+        if self._pool is None:
+            self._pool = mp.Pool(processes=self.processes)
+        return self._pool
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def map_groups(self, optimizer: MultiObjectiveFleetOptimizer, generations: int, population_size: int,
+                   keys: List[Tuple] = None, seeds: Dict = None) -> Tuple[List[List[Dict]], List[float]]:
+        """
+        Optimizes the given groups of the optimizer (all by default), heaviest estimated
+        groups first, handing out one group at a time so no worker waits behind a large chunk.
+        seeds maps a group to the SeedSequence of its random stream (from group_seeds).
+        Each group's convergence report is copied into optimizer.convergence_reports,
+        and its generation trace, when recorded, is appended to optimizer.generation_trace.
+        Returns:
+            Tuple[List[List[Dict]], List[float]]: result rows and wall-clock seconds
+            per group, both in the order of keys.
+        """
+        keys = list(optimizer.vehicles_by_size_distance.keys()) if keys is None else list(keys)
+        order = sorted(range(len(keys)),
+                       key=lambda i: optimizer.estimate_group_cost(keys[i], generations, population_size),
+                       reverse=True)
+        seeds = seeds or {}
+        tasks = [(i, optimizer._group_task(keys[i], generations, population_size, seeds.get(keys[i]))) for i in order]
+
+        results = [None] * len(keys)
+        seconds = [0.0] * len(keys)
+        for index, rows, elapsed, report, trace in self.start().imap_unordered(_optimize_group, tasks, chunksize=1):
+            results[index] = rows
+            seconds[index] = elapsed
+            if report:
+                optimizer.convergence_reports[keys[index]] = report
+            optimizer.generation_trace.extend(trace)
+        return results, seconds
@@ -0,0 +1,180 @@
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Tuple
+from pareto import fast_non_dominated_sort, hypervolume_2d, SCALED_REFERENCE
+from group_context import GroupContext
+from tradeoff_topsis_parallelize import MultiObjectiveFleetOptimizer
+
+class VectorizedFleetOptimizer(MultiObjectiveFleetOptimizer):
+    """
+    NSGA-II engine that keeps each size-distance group's population as a
+    (population_size, n_vehicle_types) integer matrix. Cost, emissions, capacity
+    and validity for a whole generation are computed with array operations.
+    """
+    def evaluate_population(self, population: np.ndarray, context: GroupContext) -> Dict:
+        """Objectives, capacity and validity for every row of a population matrix"""
+        demand = float(context.demand)
+        used = population > 0
+        safe_counts = np.where(used, population, 1)
+        totals = population.sum(axis=1)
+
+        cost = population @ context.fixed_cost + (used * (context.fuel_costs_per_km * demand) / safe_counts).sum(axis=1)
+        emissions = used @ context.carbon_emissions_per_km * demand
+        capacity = population @ context.yearly_range
+        valid = (population >= 0).all(axis=1) & (totals > 0) & (totals <= context.max_vehicles)
+        feasible = valid & (capacity >= demand)
+
+        return {
+            'cost': cost,
+            'emissions': emissions,
+            'capacity': capacity,
+            'valid': valid,
+            'feasible': feasible,
+            'weighted_topsis': population @ context.rank,
+            'totals': totals,
+        }
+
+    def population_fitness(self, metrics: Dict, context: GroupContext) -> np.ndarray:
+        max_cost = context.max_possible_cost
+        max_emissions = context.max_possible_emissions
+        normalized_cost = 1 - (metrics['cost'] / max_cost if max_cost > 0 else 0)
+        normalized_emissions = 1 - (metrics['emissions'] / max_emissions if max_emissions > 0 else 0)
+        mean_topsis = metrics['weighted_topsis'] / np.maximum(metrics['totals'], 1)
+
+        score = (
+            self.cost_weight * normalized_cost +
+            self.emission_weight * normalized_emissions +
+            mean_topsis
+        )
+        return np.where(metrics['feasible'], score, -np.inf)
+
+    def population_objectives(self, metrics: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        cost = np.where(metrics['feasible'], metrics['cost'], np.inf)
+        emissions = np.where(metrics['feasible'], metrics['emissions'], np.inf)
+        return cost, emissions
+
+    def generate_population_matrix(self, context: GroupContext, population_size: int, rng: np.random.Generator) -> np.ndarray:
+        """Samples population_size fleets from the feasible region, drawing vehicle types by TOPSIS score"""
+        return np.array([context.sample_feasible(rng) for _ in range(population_size)], dtype=np.int64).reshape(population_size, context.n_types)
+
+    def _repair_rows(self, population: np.ndarray, context: GroupContext, rng: np.random.Generator) -> np.ndarray:
+        """Repairs, in place, the rows that left the feasible region; feasible rows are not touched"""
+        for i in np.flatnonzero(~context.is_feasible(population)):
+            population[i] = context.repair(population[i], rng)
+        return population
+
+    def crossover_matrix(self, parents1: np.ndarray, parents2: np.ndarray, context: GroupContext,
+                         rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """One-point crossover of each parent pair; children that leave the feasible region are repaired"""
+        n_types = parents1.shape[1]
+        if n_types < 2:
+            return parents1.copy(), parents2.copy()
+
+        points = rng.integers(1, n_types, size=len(parents1))
+        mask = np.arange(n_types)[None, :] < points[:, None]
+        children1 = np.where(mask, parents1, parents2)
+        children2 = np.where(mask, parents2, parents1)
+        return self._repair_rows(children1, context, rng), self._repair_rows(children2, context, rng)
+
+    def mutate_matrix(self, population: np.ndarray, context: GroupContext, rng: np.random.Generator,
+                      mutation_rate: float = 0.2) -> np.ndarray:
+        """Adds or removes one vehicle, or drops a type, per gene with probability mutation_rate, then repairs"""
+        mask = rng.random(population.shape) < mutation_rate
+        choice = rng.integers(0, 3, size=population.shape)
+        change = np.select([choice == 0, choice == 1], [-1, 1], default=-population)
+        return self._repair_rows(np.maximum(population + np.where(mask, change, 0), 0), context, rng)
+
+    def tournament_indices(self, fitness: np.ndarray, n: int, rng: np.random.Generator,
+                           tournament_size: int = 3) -> np.ndarray:
+        size = min(tournament_size, len(fitness))
+        contenders = rng.integers(0, len(fitness), size=(n, size))
+        winners = np.argmax(fitness[contenders], axis=1)
+        return contenders[np.arange(n), winners]
+
+    def crowding_order(self, cost: np.ndarray, emissions: np.ndarray) -> np.ndarray:
+        """Indices of a front sorted by crowding distance, most isolated first"""
+        n = len(cost)
+        if n <= 2:
+            return np.arange(n)
+
+        distances = np.zeros(n)
+        for values in (cost, emissions):
+            order = np.argsort(values, kind='stable')
+            distances[order[0]] = np.inf
+            distances[order[-1]] = np.inf
+            if not np.isfinite(values[order[-1]]):
+                continue
+            value_range = values[order[-1]] - values[order[0]]
+            if value_range > 0:
+                distances[order[1:-1]] += (values[order[2:]] - values[order[:-2]]) / value_range
+        return np.argsort(-distances, kind='stable')
+
+    def select_survivors(self, cost: np.ndarray, emissions: np.ndarray, population_size: int) -> np.ndarray:
+        ranks = fast_non_dominated_sort(np.column_stack([cost, emissions]))
+        survivors = []
+        for rank in range(ranks.max() + 1):
+            if len(survivors) >= population_size:
+                break
+            front = np.flatnonzero(ranks == rank)
+            if len(survivors) + len(front) <= population_size:
+                survivors.extend(front)
+            else:
+                order = self.crowding_order(cost[front], emissions[front])
+                survivors.extend(front[order[:population_size - len(survivors)]])
+        return np.array(survivors, dtype=np.int64)
+
+    def optimize(self, size_distance: Tuple, generations: int = 100, population_size: int = 50,
+                 rng: np.random.Generator = None) -> Dict:
+        context = self.group_contexts[size_distance]
+        if context.max_vehicles <= 0:
+            return None
+
+        rng = np.random.default_rng() if rng is None else rng
+        population = self.generate_population_matrix(context, population_size, rng)
+        metrics = self.evaluate_population(population, context)
+        fitness = self.population_fitness(metrics, context)
+
+        best_solution = None
+        best_fitness = float('-inf')
+        n_pairs = (population_size + 1) // 2
+        monitor = self._convergence_monitor(size_distance, generations)
+
+        for gen in range(generations):
+            parents1 = population[self.tournament_indices(fitness, n_pairs, rng)]
+            parents2 = population[self.tournament_indices(fitness, n_pairs, rng)]
+            children1, children2 = self.crossover_matrix(parents1, parents2, context, rng)
+            children1 = self.mutate_matrix(children1, context, rng)
+            children2 = self.mutate_matrix(children2, context, rng)
+
+            offspring = np.empty((2 * n_pairs, population.shape[1]), dtype=population.dtype)
+            offspring[0::2] = children1
+            offspring[1::2] = children2
+
+            combined = np.vstack([population, offspring[:population_size]])
+            combined_metrics = self.evaluate_population(combined, context)
+            cost, emissions = self.population_objectives(combined_metrics)
+
+            survivors = self.select_survivors(cost, emissions, population_size)
+            population = combined[survivors]
+            fitness = self.population_fitness(combined_metrics, context)[survivors]
+
+            best_idx = int(np.argmax(fitness))
+            if fitness[best_idx] > best_fitness:
+                best_fitness = fitness[best_idx]
+                best_solution = population[best_idx]
+
+            diversity = len(np.unique(population, axis=0)) / len(population)
+            hypervolume = None
+            if monitor.tracks_hypervolume:
+                # Infeasible rows have infinite objectives and fall outside the reference box
+                max_cost, max_emissions = context.objective_bounds
+                points = np.column_stack([cost[survivors] / max_cost, emissions[survivors] / max_emissions])
+                hypervolume = hypervolume_2d(points, SCALED_REFERENCE)
+            stop = monitor.update(best_fitness, hypervolume, diversity)
+            self.convergence_reports[size_distance] = monitor.report()
+            if stop:
+                break
+
+        if best_solution is None:
+            return None
+        return context.to_solution(best_solution)
@@ -1,32 +1,24 @@
-from utilities.my_sql_operations import MySQLOperations
+from utilities.reference_data import ReferenceData
 import pandas as pd
 
 class CarbonEmissions:
-    def __init__(self):
-        self.my_sql_operations = MySQLOperations().fetch_data
-
     def carbon_emissions_limit(self, op_year: int):
         """
         Fetches carbon emissions limit from the database
         """
-        my_sql_operations = MySQLOperations()
-        query = f"""SELECT carbon_emission FROM carbon_emissions WHERE YEAR = {op_year}"""
-        carbon_emission_limit, columns = my_sql_operations.fetch_data(query) 
-        return carbon_emission_limit[0][0]
+        reference_data = ReferenceData()
+        carbon_emission_limit = reference_data.for_year('carbon_emissions', op_year, ['carbon_emission'])
+        return carbon_emission_limit.iloc[0, 0]
     
     def total_carbon_emmissions(self, fleet_details: pd.DataFrame, op_year: int):
         """
         Calculates total carbon emissions of the fleet
         """     
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT fuel, emissions_co2_per_unit_fuel FROM fuels WHERE year = {op_year}"""
-        fuel_data, columns = my_sql_operations.fetch_data(query) 
-        fuel_df = pd.DataFrame(fuel_data, columns=columns)
+        fuel_df = reference_data.for_year('fuels', op_year, ['fuel', 'emissions_co2_per_unit_fuel'])
         
-        query = f"""SELECT * FROM vehicles_fuels"""
-        vehicles_fuels_data, columns = my_sql_operations.fetch_data(query)
-        vehicles_fuels_df = pd.DataFrame(vehicles_fuels_data, columns=columns)
+        vehicles_fuels_df = reference_data.table('vehicles_fuels')
 
         merged_df = pd.merge(
             pd.merge(fleet_details, fuel_df, left_on='Fuel', right_on='fuel', how='left'),
@@ -50,11 +42,9 @@ class CarbonEmissions:
         """
         Calculates per km carbon emissions for one vehicle
         """     
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT fuel, emissions_co2_per_unit_fuel FROM fuels WHERE year = {op_year}"""
-        fuel_data, columns = my_sql_operations.fetch_data(query) 
-        fuel_df = pd.DataFrame(fuel_data, columns=columns)
+        fuel_df = reference_data.for_year('fuels', op_year, ['fuel', 'emissions_co2_per_unit_fuel'])
 
         merged_df = pd.merge(fleet_details, fuel_df, left_on='fuel', right_on='fuel', how='left')
         
@@ -1,4 +1,4 @@
-from utilities.my_sql_operations import MySQLOperations
+from utilities.reference_data import ReferenceData
 import pandas as pd
 
 class Costs:
@@ -11,10 +11,8 @@ class Costs:
         """
         vehciles_to_buy = fleet_details[fleet_details['Type'] == 'Buy']
         
-        my_sql_operations = MySQLOperations() 
-        query = f"""SELECT id, cost FROM vehicles WHERE year = {op_year}"""
-        vehicle_costs, columns = my_sql_operations.fetch_data(query) 
-        vehicle_costs_df = pd.DataFrame(vehicle_costs, columns=columns)
+        reference_data = ReferenceData() 
+        vehicle_costs_df = reference_data.for_year('vehicles', op_year, ['id', 'cost'])
         
         merged_df = pd.merge(vehciles_to_buy, vehicle_costs_df, left_on='ID', right_on='id', how='left')
         
@@ -34,15 +32,11 @@ class Costs:
         Returns Insurance cost for the operating year
         """
         total_fleet_insurance_cost = 0
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT id, year, cost FROM vehicles"""
-        purchase_year_data, columns = my_sql_operations.fetch_data(query) 
-        purchase_year_df = pd.DataFrame(purchase_year_data, columns=columns)
+        purchase_year_df = reference_data.table('vehicles', ['id', 'year', 'cost'])
         
-        query = f"""SELECT end_of_year, insurance_cost_percent FROM cost_profiles"""
-        insurance_cost_data, columns = my_sql_operations.fetch_data(query)
-        insurance_cost_df = pd.DataFrame(insurance_cost_data, columns=columns)
+        insurance_cost_df = reference_data.table('cost_profiles', ['end_of_year', 'insurance_cost_percent'])
         
         eoy_df = pd.merge(fleet_details, purchase_year_df, left_on=['ID'], right_on=['id'], how='left')
                 
@@ -67,15 +61,11 @@ class Costs:
         Returns Maintenance cost for the operating year
         """
         total_fleet_maintainance_cost = 0
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT id, year, cost FROM vehicles"""
-        purchase_year_data, columns = my_sql_operations.fetch_data(query) 
-        purchase_year_df = pd.DataFrame(purchase_year_data, columns=columns)
+        purchase_year_df = reference_data.table('vehicles', ['id', 'year', 'cost'])
         
-        query = f"""SELECT end_of_year, maintenance_cost_percent FROM cost_profiles"""
-        maintenance_cost_data, columns = my_sql_operations.fetch_data(query)
-        maintenance_cost_df = pd.DataFrame(maintenance_cost_data, columns=columns)
+        maintenance_cost_df = reference_data.table('cost_profiles', ['end_of_year', 'maintenance_cost_percent'])
         
         eoy_df = pd.merge(fleet_details, purchase_year_df, left_on=['ID'], right_on=['id'], how='left')
                 
@@ -100,15 +90,11 @@ class Costs:
         Returns yearly fuel cost
         """
         yearly_fuel_cost = 0
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT fuel, cost_per_unit_fuel FROM fuels WHERE year = {op_year}"""
-        fuel_cost_data, columns = my_sql_operations.fetch_data(query) 
-        fuel_cost_df = pd.DataFrame(fuel_cost_data, columns=columns)
+        fuel_cost_df = reference_data.for_year('fuels', op_year, ['fuel', 'cost_per_unit_fuel'])
         
-        query = f"""SELECT * FROM vehicles_fuels"""
-        fuel_consumption_data, columns = my_sql_operations.fetch_data(query)
-        fuel_consumption_df = pd.DataFrame(fuel_consumption_data, columns=columns)
+        fuel_consumption_df = reference_data.table('vehicles_fuels')
         
         merged_df = pd.merge(
             pd.merge(fleet_details, fuel_cost_df, left_on='Fuel', right_on='fuel', how='left'),
@@ -134,14 +120,10 @@ class Costs:
         """
         vehicles_to_buy = fleet_details[fleet_details['Type'] == 'Sell']
         
-        my_sql_operations = MySQLOperations() 
-        query = f"""SELECT id, year, cost FROM vehicles WHERE year <= {op_year}"""
-        vehicle_costs, columns = my_sql_operations.fetch_data(query) 
-        vehicle_costs_df = pd.DataFrame(vehicle_costs, columns=columns)
+        reference_data = ReferenceData() 
+        vehicle_costs_df = reference_data.up_to_year('vehicles', op_year, ['id', 'year', 'cost'])
         
-        query = f"""SELECT end_of_year, resale_value_percent FROM cost_profiles"""
-        resale_value_data, columns = my_sql_operations.fetch_data(query)
-        resale_value_df = pd.DataFrame(resale_value_data, columns=columns)
+        resale_value_df = reference_data.table('cost_profiles', ['end_of_year', 'resale_value_percent'])
 
         eoy_df = pd.merge(vehicles_to_buy, vehicle_costs_df, left_on='ID', right_on='id', how='left')
                 
@@ -191,15 +173,11 @@ class Costs:
         Returns Insurance cost for one vehicle
         """
         total_fleet_insurance_cost = 0
-        my_sql_operations = MySQLOperations() 
+        reference_data = ReferenceData() 
         
-        query = f"""SELECT id, year FROM vehicles"""
-        purchase_year_data, columns = my_sql_operations.fetch_data(query) 
-        purchase_year_df = pd.DataFrame(purchase_year_data, columns=columns)
+        purchase_year_df = reference_data.table('vehicles', ['id', 'year'])
         
-        query = f"""SELECT end_of_year, insurance_cost_percent FROM cost_profiles"""
-        insurance_cost_data, columns = my_sql_operations.fetch_data(query)
-        insurance_cost_df = pd.DataFrame(insurance_cost_data, columns=columns)
+        insurance_cost_df = reference_data.table('cost_profiles', ['end_of_year', 'insurance_cost_percent'])
 
         eoy_df = pd.merge(fleet_details, purchase_year_df, left_on=['id'], right_on=['id'], how='left')
 
@@ -219,15 +197,11 @@ class Costs:
             Returns Maintenance cost for the operating year for one vehicle
             """
             total_fleet_maintainance_cost = 0
-            my_sql_operations = MySQLOperations() 
+            reference_data = ReferenceData() 
             
-            query = f"""SELECT id, year FROM vehicles"""
-            purchase_year_data, columns = my_sql_operations.fetch_data(query) 
-            purchase_year_df = pd.DataFrame(purchase_year_data, columns=columns)
+            purchase_year_df = reference_data.table('vehicles', ['id', 'year'])
             
-            query = f"""SELECT end_of_year, maintenance_cost_percent FROM cost_profiles"""
-            maintenance_cost_data, columns = my_sql_operations.fetch_data(query)
-            maintenance_cost_df = pd.DataFrame(maintenance_cost_data, columns=columns)
+            maintenance_cost_df = reference_data.table('cost_profiles', ['end_of_year', 'maintenance_cost_percent'])
             eoy_df = pd.merge(fleet_details, purchase_year_df, left_on=['id'], right_on=['id'], how='left')
                     
             eoy_df['End_of_year'] = (
@@ -246,15 +220,11 @@ class Costs:
             Returns per km fuel cost for a vehicle
             """
             yearly_fuel_cost = 0
-            my_sql_operations = MySQLOperations() 
+            reference_data = ReferenceData() 
             
-            query = f"""SELECT fuel, cost_per_unit_fuel FROM fuels WHERE year = {op_year}"""
-            fuel_cost_data, columns = my_sql_operations.fetch_data(query) 
-            fuel_cost_df = pd.DataFrame(fuel_cost_data, columns=columns)
+            fuel_cost_df = reference_data.for_year('fuels', op_year, ['fuel', 'cost_per_unit_fuel'])
             
-            query = f"""SELECT * FROM vehicles_fuels"""
-            fuel_consumption_data, columns = my_sql_operations.fetch_data(query)
-            fuel_consumption_df = pd.DataFrame(fuel_consumption_data, columns=columns)
+            fuel_consumption_df = reference_data.table('vehicles_fuels')
             
             merged_df = pd.merge(fleet_details, fuel_cost_df, left_on='fuel', right_on='fuel', how='left')
             merged_df['fuel_costs_per_km'] = (
@@ -0,0 +1,57 @@
+import hashlib
+import os
+import pickle
+
+class GroupResultCache:
+    def __init__(self, directory: str = None):
+        """
+        On-disk store of optimised rows per size-distance group, keyed by a
+        fingerprint of everything the group's optimisation depends on.
+        Args:
+            directory (str): cache folder, defaults to GROUP_CACHE_DIR or .group_cache.
+        """
+        self.directory = directory or os.getenv('GROUP_CACHE_DIR', '.group_cache')
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """
+        Stable hash of the given inputs. Group vehicle records carry the
+        demand, candidate vehicles, cost and fuel columns and any carried-over
+        fleet, so a change in any of them gives a new fingerprint.
+        """
+        return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pkl")
+
+    def get(self, key: str):
+        """
+        Returns:
+            list: stored result rows for the fingerprint, or None if absent.
+        """
+        try:
+            with open(self._path(key), 'rb') as f:
+                rows = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return rows
+
+    def put(self, key: str, rows: list):
+        os.makedirs(self.directory, exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(rows, f)
+        os.replace(tmp_path, self._path(key))
+
+    def clear(self):
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.directory, name))
+        self.hits = 0
+        self.misses = 0
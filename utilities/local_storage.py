@@ -0,0 +1,123 @@
+import os
+import re
+import sqlite3
+import pandas as pd
+
+# Input tables missing from the local store are seeded from these CSVs
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'sample_upload')
+
+_TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN|INTO|UPDATE|TABLE(?:\s+IF\s+EXISTS)?)\s+`?(\w+)`?', re.IGNORECASE)
+_TARGET_TABLE = re.compile(r'^\s*(?:DELETE\s+FROM|INSERT\s+INTO|UPDATE|CREATE\s+TABLE|DROP\s+TABLE(?:\s+IF\s+EXISTS)?)\s+`?(\w+)`?', re.IGNORECASE)
+
+class LocalColumnarStorage:
+    def __init__(self, root: str = None):
+        """
+        File-based stand-in for the MySQL input and output databases. Every
+        table is one Parquet file under <root>/<database>/, read memory-mapped.
+        SQL statements are run by SQLite over the tables they reference.
+        Needs pyarrow.
+        Args:
+            root (str): storage folder, defaults to LOCAL_DATA_DIR or data/local.
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:
+            raise ImportError("FLEET_STORAGE=local needs pyarrow: pip install pyarrow") from e
+        self.root = root or os.getenv('LOCAL_DATA_DIR', os.path.join('data', 'local'))
+
+    def _path(self, table_name: str, database: str) -> str:
+        return os.path.join(self.root, database, f"{table_name}.parquet")
+
+    def table_exists(self, table_name: str, database: str = 'output') -> int:
+        """Returns 1 if the table exists, 0 otherwise, like MySQLOperations.table_exists"""
+        if os.path.exists(self._path(table_name, database)):
+            return 1
+        if database == 'input' and os.path.exists(os.path.join(SAMPLE_DIR, f"{table_name}.csv")):
+            return 1
+        return 0
+
+    def read_table(self, table_name: str, database: str = 'input') -> pd.DataFrame:
+        path = self._path(table_name, database)
+        if os.path.exists(path):
+            return pd.read_parquet(path, memory_map=True)
+        sample_path = os.path.join(SAMPLE_DIR, f"{table_name}.csv")
+        if database == 'input' and os.path.exists(sample_path):
+            return pd.read_csv(sample_path)
+        raise ValueError(f"Table {table_name} does not exist in the local {database} store")
+
+    def write_table(self, df: pd.DataFrame, table_name: str, database: str = 'output',
+                    if_exists: str = 'replace', index: bool = True):
+        """
+        Same semantics as DataFrame.to_sql for if_exists and index.
+        """
+        if index:
+            df = df.reset_index()
+        if self.table_exists(table_name, database):
+            if if_exists == 'fail':
+                raise ValueError(f"Table {table_name} already exists")
+            if if_exists == 'append':
+                df = pd.concat([self.read_table(table_name, database), df], ignore_index=True)
+        path = self._path(table_name, database)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+
+    def drop_table(self, table_name: str, database: str = 'output'):
+        path = self._path(table_name, database)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def table_version(self, table_name: str, database: str = 'output') -> str:
+        """Modification time of the table's file, None when the table is not stored"""
+        path = self._path(table_name, database)
+        return str(os.stat(path).st_mtime_ns) if os.path.exists(path) else None
+
+    def table_columns(self, table_name: str, database: str = 'input') -> list:
+        return list(self.read_table(table_name, database).columns)
+
+    def _sqlite(self, sql: str, database: str) -> sqlite3.Connection:
+        """In-memory SQLite database holding every existing table the statement references"""
+        connection = sqlite3.connect(':memory:')
+        for table_name in set(_TABLE_REFERENCE.findall(sql)):
+            if self.table_exists(table_name, database):
+                self.read_table(table_name, database).to_sql(table_name, connection, index=False)
+        return connection
+
+    def query(self, sql: str, database: str = 'input', params: tuple = None):
+        """
+        Returns:
+            list: list of tuples containing the fetched data.
+            list: list of column names
+        """
+        connection = self._sqlite(sql, database)
+        try:
+            cursor = connection.execute(sql.replace('%s', '?'), params or ())
+            return cursor.fetchall(), [desc[0] for desc in cursor.description]
+        finally:
+            connection.close()
+
+    def execute(self, sql: str, params: tuple = None, database: str = 'output'):
+        """Runs a DELETE, INSERT, UPDATE, CREATE TABLE or DROP TABLE statement and saves the changed table"""
+        match = _TARGET_TABLE.match(sql)
+        if match is None:
+            raise ValueError(f"Unsupported statement for local storage: {sql}")
+        table_name = match.group(1)
+        if re.match(r'^\s*DROP\s', sql, re.IGNORECASE):
+            self.drop_table(table_name, database)
+            return
+
+        # SQLite keeps datetimes as text; they are parsed back so appends keep one column type
+        datetime_columns = []
+        if self.table_exists(table_name, database):
+            existing = self.read_table(table_name, database)
+            datetime_columns = [column for column in existing.columns
+                                if pd.api.types.is_datetime64_any_dtype(existing[column])]
+        connection = self._sqlite(sql, database)
+        try:
+            connection.execute(sql.replace('%s', '?'), params or ())
+            df = pd.read_sql(f'SELECT * FROM "{table_name}"', connection, parse_dates=datetime_columns)
+        finally:
+            connection.close()
+        self.write_table(df, table_name, database, if_exists='replace', index=False)
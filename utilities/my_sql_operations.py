@@ -1,12 +1,48 @@
 import mysql.connector
+import mysql.connector.pooling
 import os
+import threading
 from sqlalchemy import create_engine
 import sqlalchemy
 import pandas as pd
+from utilities.local_storage import LocalColumnarStorage
         
 from dotenv import load_dotenv
 load_dotenv(override=True)
 
+# Connection pools and engines are shared by every MySQLOperations instance in a process.
+# Keys include the process id so forked optimizer workers never reuse the parent's sockets.
+_pool_lock = threading.Lock()
+_connection_pools = {}
+_engines = {}
+
+def _pool_size():
+    return int(os.getenv('MYSQL_POOL_SIZE', 5))
+
+# Rows per multi-row INSERT statement when writing output tables
+INSERT_CHUNK_SIZE = 1000
+
+def _column_types(df):
+    """
+    Explicit SQL column types for DataFrame.to_sql, so types do not depend on
+    what pandas infers from the first rows. Text columns become VARCHAR(255),
+    or TEXT when a value is longer; appended tables keep their existing types.
+    """
+    types = {}
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            types[column] = sqlalchemy.types.Boolean()
+        elif pd.api.types.is_integer_dtype(dtype):
+            types[column] = sqlalchemy.types.BigInteger()
+        elif pd.api.types.is_float_dtype(dtype):
+            types[column] = sqlalchemy.types.Float(precision=53)
+        elif pd.api.types.is_datetime64_any_dtype(dtype):
+            types[column] = sqlalchemy.types.DateTime()
+        else:
+            length = int(df[column].dropna().astype(str).str.len().max()) if df[column].notna().any() else 0
+            types[column] = sqlalchemy.types.String(length=255) if length <= 255 else sqlalchemy.types.Text()
+    return types
+
 class MySQLOperations:
     def __init__(self):
         """
@@ -17,6 +53,8 @@ class MySQLOperations:
         self.user = os.getenv('MYSQL_USER')
         self.password = os.getenv('MYSQL_PASSWORD')
         self.input_connection_string = os.getenv('INPUT_STRING')
+        # FLEET_STORAGE=local keeps every table in local Parquet files instead of MySQL
+        self.local = LocalColumnarStorage() if os.getenv('FLEET_STORAGE', 'mysql').lower() == 'local' else None
 
     def create_connection(self, database):
         """
@@ -27,38 +65,95 @@ class MySQLOperations:
             mysql.connector.connection.MySQLConnection: connection object to the specified MySQL database.
         """
         
-        connection = mysql.connector.connect(
-            host=self.host,
-            user=self.user,
-            password=self.password,
-            database=database, 
-            port=self.port
-        )
-        return connection
+        key = (os.getpid(), self.host, self.port, self.user, database)
+        with _pool_lock:
+            pool = _connection_pools.get(key)
+            if pool is None:
+                pool = mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name=f"fleet_{database}_{os.getpid()}",
+                    pool_size=_pool_size(),
+                    pool_reset_session=True,
+                    host=self.host,
+                    user=self.user,
+                    password=self.password,
+                    database=database,
+                    port=self.port
+                )
+                _connection_pools[key] = pool
+        try:
+            # Pooled connections are reconnected if the server dropped them; close() returns them to the pool
+            return pool.get_connection()
+        except mysql.connector.errors.PoolError:
+            # Every pooled connection is in use, fall back to a one-off connection
+            return mysql.connector.connect(
+                host=self.host,
+                user=self.user,
+                password=self.password,
+                database=database, 
+                port=self.port
+            )
     
     def create_sqlalchemy_engine(self, connection_string):
-        engine = create_engine(connection_string, echo=False)
+        """
+        Returns the process's engine for the connection string, creating it on first use.
+        Connections are checked with a ping before use and recycled hourly.
+        """
+        key = (os.getpid(), connection_string)
+        with _pool_lock:
+            engine = _engines.get(key)
+            if engine is None:
+                engine = create_engine(
+                    connection_string,
+                    echo=False,
+                    pool_size=_pool_size(),
+                    pool_pre_ping=True,
+                    pool_recycle=3600
+                )
+                _engines[key] = engine
         return engine
 
-    def fetch_data(self,query, database = 'input'):
+    def fetch_data(self,query, database = 'input', params=None):
         """
         Fetch data from the MySQL database
         Args:
             query (str): SQL query to fetch data from the MySQL database.
+            params (tuple): values bound to %s placeholders in the query.
         Returns:
             list: list of tuples containing the fetched data.
             list: list of column names
         """
+        if self.local is not None:
+            return self.local.query(query, database, params)
         connection = self.create_connection(database)
         cursor = connection.cursor()
-        cursor.execute(query)
+        cursor.execute(query, params)
         data = cursor.fetchall()
         columns = [desc[0] for desc in cursor.description]
         cursor.close()
         connection.close()
         return data, columns
     
+    def execute(self, query, params=None, database='output'):
+        """
+        Run a statement that returns no rows and commit it
+        Args:
+            query (str): SQL statement, with %s placeholders for params.
+            params (tuple): values bound to the placeholders.
+        """
+        if self.local is not None:
+            return self.local.execute(query, params, database)
+        connection = self.create_connection(database)
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, params)
+            connection.commit()
+        finally:
+            cursor.close()
+            connection.close()
+
     def table_exists(self, table_name):
+        if self.local is not None:
+            return self.local.table_exists(table_name, 'output')
         connection = self.create_connection('output')
         cursor = connection.cursor()
         query = f"""
@@ -73,18 +168,40 @@ class MySQLOperations:
         connection.close()
         return exists
     
-    def push_output_data(self, data, table_name):
+    def push_output_data(self, data, table_name, if_exists='replace', index=True):
+        """
+        Push data to the output database, replacing the existing table by default.
+        Args:
+            if_exists (str): passed to DataFrame.to_sql.
+            index (bool): passed to DataFrame.to_sql.
+        """
+        self.push_output_tables([(data, table_name, if_exists, index)])
+
+    def push_output_tables(self, writes):
         """
-        Push data to the output database, replacing the existing table.
+        Write several tables to the output database in one transaction, using
+        multi-row INSERTs and explicit column types. Note that MySQL commits
+        implicitly when a table is dropped or created.
+        Args:
+            writes (list): (data, table_name, if_exists, index) tuples, written in order.
         """
+        if self.local is not None:
+            for data, table_name, if_exists, index in writes:
+                self.local.write_table(data, table_name, 'output', if_exists=if_exists, index=index)
+            return
         connection_string = os.getenv('OUTPUT_STRING')
         engine = self.create_sqlalchemy_engine(connection_string)
-        data.to_sql(table_name, con=engine, if_exists='replace')
+        with engine.begin() as connection:
+            for data, table_name, if_exists, index in writes:
+                data.to_sql(table_name, con=connection, if_exists=if_exists, index=index,
+                            method='multi', chunksize=INSERT_CHUNK_SIZE, dtype=_column_types(data))
 
     def fetch_input_data(self, table_name):
         """
         Fetch data from the input database.
         """
+        if self.local is not None:
+            return self.local.read_table(table_name, 'input')
         connection = self.create_connection('input')
         cursor = connection.cursor()
         query = f"SELECT * FROM {table_name};"
@@ -100,6 +217,8 @@ class MySQLOperations:
         """
         Fetch data from the output database.
         """
+        if self.local is not None:
+            return self.local.read_table(table_name, 'output')
         connection = self.create_connection('output')
         cursor = connection.cursor()
         query = f"SELECT * FROM {table_name};"
@@ -111,10 +230,60 @@ class MySQLOperations:
         connection.close()
         return df
 
+    def query_output(self, table_name, columns=None, filters=None):
+        """
+        Fetch part of an output table, with the filtering done by the database.
+        Args:
+            table_name (str): output table.
+            columns (list): columns to return, all columns when None.
+            filters (dict): column -> value, combined with AND.
+        Returns:
+            pd.DataFrame: matching rows.
+        """
+        select = ", ".join(f"`{column}`" for column in columns) if columns else "*"
+        query = f"SELECT {select} FROM `{table_name}`"
+        params = None
+        if filters:
+            query += " WHERE " + " AND ".join(f"`{column}` = %s" for column in filters)
+            params = tuple(filters.values())
+        data, result_columns = self.fetch_data(query, database='output', params=params)
+        return pd.DataFrame(data, columns=result_columns)
+
+    def distinct_output_values(self, table_name, column):
+        """Sorted distinct values of one column of an output table"""
+        data, _ = self.fetch_data(f"SELECT DISTINCT `{column}` FROM `{table_name}` ORDER BY `{column}`", database='output')
+        return [row[0] for row in data]
+
+    def create_index(self, table_name, column):
+        """
+        Index a column of an output table so filtered queries on it avoid a full scan.
+        Not needed for local storage, which reads whole files.
+        """
+        if self.local is not None:
+            return
+        index_name = "idx_" + "".join(c if c.isalnum() else "_" for c in column.lower())
+        self.execute(f"CREATE INDEX `{index_name}` ON `{table_name}` (`{column}`)")
+
+    def table_version(self, table_name):
+        """
+        Token that changes whenever an output table is rewritten. Every run
+        replaces its output tables, so this identifies the run that wrote the table.
+        """
+        if self.local is not None:
+            return self.local.table_version(table_name, 'output')
+        data, _ = self.fetch_data(
+            """SELECT CREATE_TIME, UPDATE_TIME FROM information_schema.tables
+               WHERE table_schema = DATABASE() AND table_name = %s""",
+            database='output', params=(table_name,)
+        )
+        return str(data[0]) if data else None
+
     def get_table_columns(self, table_name):
         """
         Fetch existing column names from the database for a given table.
         """
+        if self.local is not None:
+            return self.local.table_columns(table_name, 'input')
         connection = self.create_connection('input')
         cursor = connection.cursor()
         query = f"""
@@ -132,6 +301,12 @@ class MySQLOperations:
         """
         Replaces all existing rows in the table with new data from CSV.
         """
+        if self.local is not None:
+            db_columns = self.local.table_columns(table_name, 'input')
+            df = df[[col for col in df.columns if col in db_columns]]
+            if df.empty:
+                raise ValueError("No matching columns found between CSV and database.")
+            return self.local.write_table(df, table_name, 'input', index=False)
         connection = self.create_connection('input')
         cursor = connection.cursor()
 
@@ -175,6 +350,8 @@ class MySQLOperations:
         Returns:
         None
         """
+        if self.local is not None:
+            return self.local.write_table(edited_df, table_name, 'input', index=False)
         conn = self.create_sqlalchemy_engine(self.input_connection_string)
         conn.begin()
         try:
@@ -0,0 +1,52 @@
+from collections import OrderedDict
+
+class ObjectiveCache:
+    def __init__(self, max_size: int = 100000):
+        """
+        Bounded least-recently-used cache for objective evaluations.
+        Args:
+            max_size (int): maximum number of genotypes kept before the oldest entries are evicted.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value for key, calling compute() only on a miss.
+        Args:
+            key (tuple): immutable genotype key, e.g. (size_distance, vehicle counts).
+            compute (callable): zero-argument function returning the objectives.
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Returns hit/miss counters and current size
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
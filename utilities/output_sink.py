@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from utilities.my_sql_operations import MySQLOperations
+import pandas as pd
+
+class AsyncOutputSink:
+    def __init__(self, enabled: bool = True):
+        """
+        Writes result frames to the output database from a background thread,
+        so the optimisation loop does not wait on table writes. Writes are
+        applied one at a time in the order they were submitted.
+        Args:
+            enabled (bool): when False, writes are dropped without touching the database.
+        """
+        self.enabled = enabled
+        self.sqlops = MySQLOperations()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _write(self, writes: list):
+        self.sqlops.push_output_tables(writes)
+
+    def write(self, df: pd.DataFrame, table_name: str, if_exists: str = 'replace', index: bool = True):
+        """
+        Queues a table write. The frame is copied, so the caller may keep modifying it.
+        Args:
+            df (pd.DataFrame): data to write.
+            table_name (str): destination table.
+            if_exists (str): passed to DataFrame.to_sql.
+            index (bool): passed to DataFrame.to_sql.
+        """
+        self.write_tables([(df, table_name, if_exists, index)])
+
+    def write_tables(self, writes: list):
+        """
+        Queues several table writes that are applied together in one transaction.
+        Args:
+            writes (list): (df, table_name, if_exists, index) tuples.
+        """
+        if not self.enabled:
+            return
+        writes = [(df.copy(), table_name, if_exists, index) for df, table_name, if_exists, index in writes]
+        self._pending.append(self._executor.submit(self._write, writes))
+
+    def flush(self):
+        """Waits for every queued write and re-raises the first failure"""
+        pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
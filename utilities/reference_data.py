@@ -0,0 +1,89 @@
+import hashlib
+import threading
+from utilities.my_sql_operations import MySQLOperations
+import pandas as pd
+
+REFERENCE_TABLES = ['vehicles', 'vehicles_fuels', 'fuels', 'cost_profiles', 'demand', 'carbon_emissions']
+# Tables the optimisation pipeline reads, i.e. the ones that define a run's input data
+INPUT_TABLES = ['vehicles', 'vehicles_fuels', 'fuels', 'cost_profiles', 'demand']
+
+class ReferenceData:
+    """
+    Process-wide snapshot of the input reference tables. Each table is read
+    from MySQL once and then served from memory, with per-year slices kept
+    for the year-filtered lookups. Call invalidate() after a table is
+    uploaded or edited so the next lookup reloads it.
+    """
+    _lock = threading.Lock()
+    _tables = {}
+    _year_slices = {}
+
+    def __init__(self):
+        self.my_sql_operations = MySQLOperations()
+
+    def _load(self, table_name: str) -> pd.DataFrame:
+        with self._lock:
+            if table_name not in self._tables:
+                data, columns = self.my_sql_operations.fetch_data(f"""SELECT * FROM {table_name}""")
+                self._tables[table_name] = pd.DataFrame(data, columns=columns)
+                self._year_slices.pop(table_name, None)
+            return self._tables[table_name]
+
+    def table(self, table_name: str, columns: list = None) -> pd.DataFrame:
+        """
+        Returns a copy of a reference table, equivalent to SELECT <columns> FROM table_name.
+        Args:
+            table_name (str): one of REFERENCE_TABLES.
+            columns (list): columns to keep, all columns when None.
+        Returns:
+            pd.DataFrame: table rows in database order.
+        """
+        df = self._load(table_name)
+        return (df if columns is None else df[columns]).copy()
+
+    def for_year(self, table_name: str, year: int, columns: list = None) -> pd.DataFrame:
+        """
+        Rows of a reference table for one year, equivalent to
+        SELECT <columns> FROM table_name WHERE year = {year}.
+        """
+        df = self._load(table_name)
+        with self._lock:
+            slices = self._year_slices.get(table_name)
+            if slices is None:
+                year_column = next(column for column in df.columns if column.lower() == 'year')
+                slices = {key: group for key, group in df.groupby(year_column, sort=False)}
+                self._year_slices[table_name] = slices
+        rows = slices.get(year, df.iloc[0:0])
+        return (rows if columns is None else rows[columns]).reset_index(drop=True)
+
+    def up_to_year(self, table_name: str, year: int, columns: list = None) -> pd.DataFrame:
+        """Rows of a reference table with year <= {year}, in database order"""
+        df = self._load(table_name)
+        year_column = next(column for column in df.columns if column.lower() == 'year')
+        rows = df[df[year_column] <= year]
+        return (rows if columns is None else rows[columns]).reset_index(drop=True)
+
+    def version(self, tables: list = None) -> str:
+        """
+        Content hash of the given tables (the pipeline inputs by default). Any
+        edited value, added or removed row, or renamed column changes it.
+        """
+        digest = hashlib.sha256()
+        for table_name in tables or INPUT_TABLES:
+            df = self._load(table_name)
+            digest.update(repr((table_name, list(df.columns))).encode())
+            digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    @classmethod
+    def invalidate(cls, table_name: str = None):
+        """
+        Drops the snapshot of one table, or of every table when table_name is None.
+        """
+        with cls._lock:
+            if table_name is None:
+                cls._tables.clear()
+                cls._year_slices.clear()
+            else:
+                cls._tables.pop(table_name, None)
+                cls._year_slices.pop(table_name, None)
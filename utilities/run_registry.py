@@ -0,0 +1,86 @@
+import hashlib
+import json
+from datetime import datetime
+from utilities.my_sql_operations import MySQLOperations
+import pandas as pd
+
+class RunRegistry:
+    def __init__(self):
+        """
+        Keyed store of complete optimisation runs in the output database.
+        Each run's rows are appended to run_<name> tables with a run_id column,
+        and run_registry lists the parameters behind every stored run_id.
+        """
+        self.sqlops = MySQLOperations()
+
+    @staticmethod
+    def run_key(**params) -> str:
+        """
+        Identifier of a run: a hash of the input data version and every parameter
+        that affects the result, e.g. weights, generations, population_size,
+        prev_years, engine and seed.
+        """
+        return hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()[:32]
+
+    def exists(self, run_id: str) -> bool:
+        if self.sqlops.table_exists('run_registry') != 1:
+            return False
+        query = f"""SELECT COUNT(*) FROM run_registry WHERE run_id = '{run_id}'"""
+        data, _ = self.sqlops.fetch_data(query, database='output')
+        return data[0][0] > 0
+
+    def load(self, run_id: str, name: str) -> pd.DataFrame:
+        """
+        Returns:
+            pd.DataFrame: rows stored under name for the run, without the run_id column.
+        """
+        query = f"""SELECT * FROM run_{name} WHERE run_id = '{run_id}'"""
+        data, columns = self.sqlops.fetch_data(query, database='output')
+        return pd.DataFrame(data, columns=columns).drop(columns=['run_id'])
+
+    def store(self, run_id: str, params: dict, frames: dict):
+        """
+        Saves a finished run.
+        Args:
+            run_id (str): key from run_key.
+            params (dict): parameters recorded next to the key.
+            frames (dict): name -> DataFrame, stored in table run_<name>.
+        """
+        for name in list(frames) + ['registry']:
+            if self.sqlops.table_exists(f'run_{name}') == 1:
+                self.sqlops.execute(f"DELETE FROM run_{name} WHERE run_id = %s", (run_id,))
+
+        registry_row = pd.DataFrame([{
+            'run_id': run_id,
+            'params': json.dumps(params, sort_keys=True, default=str),
+            'tables': ','.join(frames.keys()),
+            'created_at': datetime.now(),
+        }])
+        # The registry row goes in last, in the same transaction as the run's rows
+        writes = [(df.assign(run_id=run_id), f'run_{name}', 'append', False) for name, df in frames.items()]
+        writes.append((registry_row, 'run_registry', 'append', False))
+        self.sqlops.push_output_tables(writes)
+
+    def stored_names(self, run_id: str) -> list:
+        """
+        Returns:
+            list: names of the frames stored for the run.
+        """
+        query = f"""SELECT `tables` FROM run_registry WHERE run_id = '{run_id}'"""
+        data, _ = self.sqlops.fetch_data(query, database='output')
+        return data[0][0].split(',') if data and data[0][0] else []
+
+    def publish(self, run_id: str, tables: dict):
+        """
+        Copies a stored run into the fixed output tables read by the dashboard pages,
+        inside the database so no rows travel to the client. Names the run did not
+        store are skipped, leaving their tables as a fresh run would.
+        Args:
+            tables (dict): stored name -> destination table.
+        """
+        stored = self.stored_names(run_id)
+        for name, table_name in tables.items():
+            if name not in stored or self.sqlops.table_exists(f'run_{name}') != 1:
+                continue
+            self.sqlops.execute(f"DROP TABLE IF EXISTS `{table_name}`")
+            self.sqlops.execute(f"CREATE TABLE `{table_name}` AS SELECT * FROM run_{name} WHERE run_id = %s", (run_id,))
@@ -4,10 +4,29 @@ import plotly.express as px
 import plotly.graph_objects as go
 from utilities.my_sql_operations import MySQLOperations
 
-# Fetch data
 sqlops = MySQLOperations()
-df = sqlops.fetch_output_data('combined_multi_objective_fleet_allocation_eval')
-summary_df = sqlops.fetch_output_data('multiobjective_summary')
+ALLOCATION_TABLE = 'combined_multi_objective_fleet_allocation_eval'
+DASHBOARD_COLUMNS = [
+    'size', 'Distance_demand', 'vehicle', 'fuel', 'demand', 'No_of_vehicles', 'DemandFulfillment', 'Utilization',
+    'Total_Cost', 'Total_CE', 'fuel_costs_per_km', 'insurance_cost', 'maintenance_cost', 'carbon_emissions_per_km',
+]
+
+# Only the selected year's rows and the charted columns are fetched. Results are cached
+# per run (the table version changes whenever a run rewrites it), so widget changes
+# that revisit a year do not query the database again.
+@st.cache_data(show_spinner=False)
+def load_years(run_version):
+    return sqlops.distinct_output_values(ALLOCATION_TABLE, 'Operating Year')
+
+@st.cache_data(show_spinner=False)
+def load_year(run_version, year):
+    return sqlops.query_output(ALLOCATION_TABLE, DASHBOARD_COLUMNS, {'Operating Year': year})
+
+@st.cache_data(show_spinner=False)
+def load_summary(run_version, year):
+    return sqlops.query_output('multiobjective_summary', filters={'Year': year})
+
+run_version = sqlops.table_version(ALLOCATION_TABLE)
 
 # Streamlit page configuration
 # st.set_page_config(layout="wide")
@@ -29,10 +48,10 @@ col1, col2 = st.columns(2)
 with col1:    
     st.title("Analytics Dashboard", anchor=False)
 with col2:
-    year = st.selectbox("Year", df['Operating Year'].unique())
+    year = st.selectbox("Year", load_years(run_version))
     
-df_filtered = df[df['Operating Year']== int(year)]
-summary_df_filtered = summary_df[summary_df['Year']== int(year)]
+df_filtered = load_year(run_version, int(year))
+summary_df_filtered = load_summary(run_version, int(year))
 
 # KPI Metrics
 col1, col2 = st.columns(2)
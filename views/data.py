@@ -5,6 +5,7 @@ import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from utilities.my_sql_operations import MySQLOperations
+from utilities.reference_data import ReferenceData
 
 # Initialize SQL operations
 try:
@@ -48,6 +49,7 @@ with tab1:
             else:
                 table_name = table_options[selected_table]  # Get actual table name
                 sqlops.push_input_data(df, table_name)  # Insert into the selected table
+                ReferenceData.invalidate(table_name)  # Next run reads the new data
                 st.success(f"✅ Data uploaded successfully to {table_name}!")
                 st.rerun()  # Refresh the page
         except pd.errors.EmptyDataError:
@@ -76,6 +78,7 @@ with tab2:
                 if st.button(f"💾 Save Changes to {edit_table}"):
                     try:
                         sqlops.update_table_data(table_name, edited_df)  # Update database
+                        ReferenceData.invalidate(table_name)  # Next run reads the new data
                         st.success(f"✅ {edit_table} table updated successfully!")
                         st.rerun()  # Refresh the page
                     except Exception as e:
@@ -1,6 +1,5 @@
 import streamlit as st
 import pandas as pd
-import os
 from utilities.my_sql_operations import MySQLOperations
 from buysell import generate_buy_sell_use_plan
 
@@ -18,25 +17,34 @@ st.markdown(
 )
 
 sqlops = MySQLOperations()
-df = sqlops.fetch_output_data('combined_multi_objective_fleet_allocation_eval')
-summary_df = sqlops.fetch_output_data('multiobjective_summary')
+ALLOCATION_TABLE = 'combined_multi_objective_fleet_allocation_eval'
 
-connection_string = os.getenv('OUTPUT_STRING')
+# The plan covers every year but needs only three columns; it is built and saved once
+# per run (the table version changes whenever a run rewrites the table)
+@st.cache_data(show_spinner=False)
+def build_plan(run_version):
+    df = sqlops.query_output(ALLOCATION_TABLE, ['Operating Year', 'id', 'No_of_vehicles'])
+    if df.empty:
+        return df
+    plan_df = generate_buy_sell_use_plan(df)
+    sqlops.push_output_data(plan_df, 'fleet_plan')
+    return plan_df
+
+@st.cache_data(show_spinner=False)
+def load_summary(run_version, year):
+    return sqlops.query_output('multiobjective_summary', filters={'Year': year})
+
+run_version = sqlops.table_version(ALLOCATION_TABLE)
+plan_df = build_plan(run_version)
 
-if df.empty:
+if plan_df.empty:
     st.warning("No data found. Please check your database.")
 else:
-    years = df["Operating Year"].unique()
+    years = plan_df["Operating Year"].unique()
     selected_year = st.selectbox("Select Year", sorted(years))
     
-    plan_df = generate_buy_sell_use_plan(df)
-            
-    engine = sqlops.create_sqlalchemy_engine(connection_string)
-    plan_df.to_sql(f'fleet_plan', con=engine, if_exists='replace')
-    
     filtered_plan_df = plan_df[plan_df["Operating Year"] == selected_year]
-    df_filtered = df[df["Operating Year"] == selected_year]
-    summary_df_filtered = summary_df[summary_df['Year']== int(selected_year)]
+    summary_df_filtered = load_summary(run_version, int(selected_year))
     col1, col3 = st.columns(2)
     col1.metric("Total Cost of Vehicle Acquisition for the year", f"₹ {summary_df_filtered['TotalCost'].iloc[0]}", border=True)
     # col2.metric("Total Recievables from vehicle sales", f"₹ 0", border=True)
@@ -4,6 +4,9 @@ import pandas as pd
 from utilities.my_sql_operations import MySQLOperations
 from main_tradeoff_topsis import optimization
 from main_tradeoff_topsis_parallelize import parallel_optimization
+from tradeoff_front import select_from_front
+from utilities.evaluation import Evaluation
+from topsis import Topsis
 
 sqlops = MySQLOperations()
 
@@ -82,6 +85,37 @@ with tabs[0]:
         parallel = st.checkbox("Enable Parallel Execution")
         cost_weight, carbon_emissions_weight = (1, 0) if objective == "Cost" else (0, 1)
 
+    # The vectorized engine is only available in the parallel pipeline
+    solver_options = {"NSGA-II": "ga", "Exact (Integer Programming)": "exact"}
+    if parallel:
+        solver_options = {"NSGA-II": "ga", "Vectorized NSGA-II": "vectorized", "Exact (Integer Programming)": "exact", "Pareto Front": "pareto"}
+    solver = st.radio("Solver", list(solver_options.keys()), horizontal=True)
+    engine = solver_options[solver]
+    reuse_results = st.checkbox("Reuse results of unchanged groups", value=False,
+                                help="Only groups whose demand, vehicles, costs or carried-over fleet changed since an earlier run with the same settings are optimised again.")
+    seed = st.number_input("Random Seed", min_value=0, value=0, step=1,
+                           help="Runs with the same seed, settings and input data give identical results.")
+    convergence = None
+    if parallel and engine in ("ga", "vectorized"):
+        with st.expander("Early Stopping"):
+            early_stopping = st.checkbox("Stop groups that have converged", value=True)
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                patience = st.number_input("Patience (generations)", min_value=1, value=10,
+                                           help="Stop after this many generations without a better solution.")
+            with col2:
+                hypervolume_tolerance = st.number_input("Hypervolume Tolerance", min_value=0.0, value=1e-4, format="%.6f",
+                                                        help="Stop when the front's hypervolume changes by less than this over 5 generations. 0 disables it.")
+            with col3:
+                min_diversity = st.number_input("Minimum Diversity", min_value=0.0, max_value=1.0, value=0.05,
+                                                help="Stop when the share of distinct solutions in the population falls below this. 0 disables it.")
+            if early_stopping:
+                convergence = {
+                    "patience": int(patience),
+                    "hypervolume_tolerance": hypervolume_tolerance or None,
+                    "min_diversity": min_diversity or None,
+                }
+
 # with tabs[1]:
 #     param3 = st.text_area("Advanced Parameter")
 
@@ -90,6 +124,10 @@ if "df_output" not in st.session_state:
     st.session_state.df_output = None
 if "success_message" not in st.session_state:
     st.session_state.success_message = None
+if "pareto_front" not in st.session_state:
+    st.session_state.pareto_front = None
+if "topsis" not in st.session_state:
+    st.session_state.topsis = None
 
 
 # Function to display loading modal
@@ -113,15 +151,19 @@ def run_algorithm():
 
     start_time = time.time()  # Start timer
 
+    # Kept after the run so TOPSIS scores can be recomputed for new weights without renormalising
+    st.session_state.topsis = Topsis()
+
     # Run appropriate optimization function
     if parallel:
-        parallel_optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year)
+        parallel_optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year, engine, tps=st.session_state.topsis, reuse_results=reuse_results, use_registry=True, seed=int(seed), convergence=convergence)
     else:
-        optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year)
+        optimization(cost_weight, carbon_emissions_weight, generations, population_size, prev_years, min_year, max_year, engine, tps=st.session_state.topsis, reuse_results=reuse_results, use_registry=True, seed=int(seed))
 
     execution_time = time.time() - start_time  # Calculate duration
 
     st.session_state.df_output = sqlops.fetch_output_data('combined_multi_objective_fleet_allocation_eval')
+    st.session_state.pareto_front = sqlops.fetch_output_data('pareto_front') if engine == "pareto" else None
     st.session_state.success_message = f"Algorithm Completed in {execution_time:.2f} seconds!"
 
     st.rerun()  # Close modal after execution
@@ -143,4 +185,18 @@ if st.session_state.df_output is not None:
 
     # Filter and display the DataFrame
     df_filtered = st.session_state.df_output[st.session_state.df_output['Operating Year'] == int(year)]
+
+    # With a stored Pareto front, weight changes are answered without rerunning the optimisation
+    if st.session_state.pareto_front is not None:
+        front_df = st.session_state.pareto_front.drop(columns=['index'], errors='ignore')
+        front_year = front_df[front_df['Operating Year'] == int(year)]
+        df_filtered = Evaluation().apply_metrics_to_dataframe(
+            select_from_front(front_year, cost_weight, carbon_emissions_weight).reset_index(drop=True)
+        )
+        st.caption("Selected from the stored Pareto front for the current weights, using the fleet carried over in the last run.")
     st.dataframe(df_filtered)
+
+    if st.session_state.topsis is not None and int(year) in st.session_state.topsis.normalised:
+        with st.expander("TOPSIS ranking for the current weights"):
+            rescored = st.session_state.topsis.rescore(int(year), [carbon_emissions_weight, cost_weight, cost_weight])
+            st.dataframe(rescored[['size', 'Distance_demand', 'id', 'vehicle', 'fuel', 'Topsis_Score', 'Rank']])